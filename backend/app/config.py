@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     sentry_release: str | None = None
     cache_backend: Literal["memory", "redis"] = "memory"
     redis_url: str | None = None
+    advisory_geocode_mode: Literal["all", "danger", "off"] = "all"
 
     model_config = {"env_file": ".env"}
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 from contextvars import ContextVar, Token
 from datetime import datetime, timezone
 from typing import Any, Literal
 
+import orjson
+
 _request_id_ctx: ContextVar[str] = ContextVar("request_id", default="-")
 _logging_configured = False
 
@@ -44,7 +45,7 @@ class JsonLogFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, default=str)
+        return orjson.dumps(payload, default=str).decode()
 
 
 class PlainLogFormatter(logging.Formatter):
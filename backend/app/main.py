@@ -1,13 +1,19 @@
 import logging
+import mimetypes
 import time
 import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    PlainTextResponse,
+    Response,
+)
 
 from .config import settings
 from .logging_config import configure_logging, reset_request_id, set_request_id
@@ -110,9 +116,10 @@ async def request_context_middleware(request: Request, call_next):
     return response
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 async def health():
-    return {"status": "ok"}
+    # Kept async: a sync handler would be dispatched to the threadpool.
+    return ORJSONResponse({"status": "ok"})
 
 
 app.include_router(router)
@@ -122,12 +129,48 @@ app.include_router(router)
 # In local dev, this directory doesn't exist so the catch-all is never registered.
 STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
 
+# Vite emits content-hashed asset filenames, so they can be cached forever.
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def load_static_assets(assets_dir: Path) -> dict[str, tuple[bytes, str]]:
+    """Read every file under *assets_dir* into memory.
+
+    Returns a mapping of POSIX path relative to *assets_dir* to
+    ``(content, media_type)``.
+    """
+    assets: dict[str, tuple[bytes, str]] = {}
+    if not assets_dir.is_dir():
+        return assets
+    for path in assets_dir.rglob("*"):
+        if path.is_file():
+            media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            assets[path.relative_to(assets_dir).as_posix()] = (path.read_bytes(), media_type)
+    return assets
+
+
 if STATIC_DIR.is_dir():
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="static-assets")
+    ASSET_CACHE = load_static_assets(STATIC_DIR / "assets")
+    INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+
+    # HEAD is answered too, as the StaticFiles mount this replaces did
+    @app.api_route(
+        "/assets/{asset_path:path}", methods=["GET", "HEAD"], include_in_schema=False
+    )
+    async def serve_asset(asset_path: str):
+        asset = ASSET_CACHE.get(asset_path)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        content, media_type = asset
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={"Cache-Control": ASSET_CACHE_CONTROL},
+        )
 
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
         file_path = STATIC_DIR / full_path
         if full_path and file_path.is_file():
             return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+        return Response(content=INDEX_HTML, media_type="text/html")
@@ -7,8 +7,11 @@ from __future__ import annotations
 
 import os
 import numpy as np
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 import joblib
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
 
 FEATURE_NAMES = [
     "duration_ratio",
@@ -25,7 +28,11 @@ FEATURE_NAMES = [
 N_SAMPLES = 5000
 RANDOM_SEED = 42
 
+# zlib level 3: a good size/speed trade-off that needs no extra packages to load
+JOBLIB_COMPRESS = 3
+
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "route_model.joblib")
+ONNX_MODEL_PATH = os.path.join(os.path.dirname(__file__), "route_model.onnx")
 
 
 def _generate_synthetic_data(
@@ -97,15 +104,31 @@ def _generate_synthetic_data(
     noise = rng.normal(0, 1.5, n)
     y = np.clip(raw_score + noise, 0, 100)
 
-    return X, y
+    # Train on float32, matching the dtype fed to the model at inference
+    return X.astype(np.float32), y.astype(np.float32)
+
+
+def _export_onnx(model: HistGradientBoostingRegressor) -> None:
+    """Export the fitted model to ONNX for inference with ONNX Runtime.
+
+    Not optional: the service prefers the ``.onnx`` file whenever it exists,
+    so a skipped export would leave a stale model serving requests.
+    """
+    onx = convert_sklearn(
+        model,
+        initial_types=[("input", FloatTensorType([None, len(FEATURE_NAMES)]))],
+    )
+    with open(ONNX_MODEL_PATH, "wb") as f:
+        f.write(onx.SerializeToString())
+    print(f"ONNX model saved to {ONNX_MODEL_PATH}")
 
 
 def train_and_save() -> None:
     rng = np.random.default_rng(RANDOM_SEED)
     X, y = _generate_synthetic_data(N_SAMPLES, rng)
 
-    model = GradientBoostingRegressor(
-        n_estimators=200,
+    model = HistGradientBoostingRegressor(
+        max_iter=200,
         max_depth=4,
         learning_rate=0.1,
         min_samples_leaf=10,
@@ -117,15 +140,21 @@ def train_and_save() -> None:
     train_score = model.score(X, y)
     print(f"Training R² = {train_score:.4f}")
 
-    # Show feature importances
+    # Show feature importances (histogram boosting has no impurity-based
+    # importances, so use permutation importance instead)
+    importances = permutation_importance(
+        model, X, y, n_repeats=5, random_state=RANDOM_SEED
+    ).importances_mean
     for name, importance in sorted(
-        zip(FEATURE_NAMES, model.feature_importances_), key=lambda x: -x[1]
+        zip(FEATURE_NAMES, importances), key=lambda x: -x[1]
     ):
         print(f"  {name}: {importance:.4f}")
 
-    joblib.dump(model, MODEL_PATH)
+    joblib.dump(model, MODEL_PATH, compress=JOBLIB_COMPRESS)
     print(f"\nModel saved to {MODEL_PATH}")
 
+    _export_onnx(model)
+
 
 if __name__ == "__main__":
     train_and_save()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import AwareDatetime, BaseModel, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class RouteRequest(BaseModel):
@@ -18,6 +18,10 @@ class LatLng(BaseModel):
 
 
 class WeatherData(BaseModel):
+    # Instances are shared between waypoints of a cell/hour and kept in the
+    # weather cache, so they must not be modified after construction.
+    model_config = ConfigDict(frozen=True)
+
     temperature_c: float
     apparent_temperature_c: float
     precipitation_mm: float
@@ -43,6 +47,10 @@ class RouteWithWeather(BaseModel):
     total_distance_km: float
     waypoints: list[Waypoint]
 
+    # Per-field weather arrays for the waypoints (scoring.WeatherColumns),
+    # attached once weather is known so scoring can skip attribute access.
+    _weather_columns: Any = PrivateAttr(default=None)
+
 
 class WeatherAdvisory(BaseModel):
     type: str
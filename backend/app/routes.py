@@ -1,91 +1,153 @@
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
+from typing import NamedTuple
 
 import httpx
-from fastapi import APIRouter, HTTPException, Request
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 from .config import settings
-from .models import RouteRequest, RouteWithWeather, MultiRouteResponse
+from .models import (
+    MultiRouteResponse,
+    RouteRecommendation,
+    RouteRequest,
+    RouteWithWeather,
+    Waypoint,
+)
 from .rate_limit import limiter
 from .services.cache import route_cache
 from .services.directions import get_routes
 from .services.sampling import sample_route_points
-from .services.scoring import score_routes
-from .services.weather import get_weather_for_waypoints
+from .services.scoring import score_routes, weather_columns
+from .services.weather import get_weather_for_waypoints, weather_cache_key
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.post("/api/route-weather", response_model=MultiRouteResponse)
+class RouteServices(NamedTuple):
+    """Pipeline stages called by the route-weather endpoint.
+
+    Injected with ``Depends(route_services)`` so tests can swap the whole
+    pipeline through ``app.dependency_overrides``.
+    """
+
+    get_routes: Callable[[str, str], Awaitable[dict]]
+    sample_route_points: Callable[[list[dict], datetime], list[Waypoint]]
+    get_weather_for_waypoints: Callable[[list[Waypoint]], Awaitable[list[Waypoint]]]
+    score_routes: Callable[[list[RouteWithWeather]], Awaitable[RouteRecommendation]]
+
+
+_SERVICES = RouteServices(
+    get_routes=get_routes,
+    sample_route_points=sample_route_points,
+    get_weather_for_waypoints=get_weather_for_waypoints,
+    score_routes=score_routes,
+)
+
+
+def route_services() -> RouteServices:
+    return _SERVICES
+
+
+def _weather_keys(waypoints: list[Waypoint]) -> np.ndarray:
+    """Weather dedup keys as an (N, 3) int array.
+
+    Each row is ``weather.weather_cache_key`` — (0.01° lat cell, 0.01° lng
+    cell, local hour) — so this dedup and the forecast cache bucket alike.
+    """
+    return np.array(
+        [weather_cache_key(wp) for wp in waypoints], dtype=np.int64
+    ).reshape(-1, 3)
+
+
+def _json_response(response: MultiRouteResponse) -> ORJSONResponse:
+    """Serialize once with orjson, bypassing FastAPI's jsonable_encoder pass."""
+    return ORJSONResponse(content=response.model_dump(mode="json"))
+
+
+@router.post(
+    "/api/route-weather",
+    response_model=MultiRouteResponse,
+    response_class=ORJSONResponse,
+)
 @limiter.limit(settings.route_weather_rate_limit)
-async def route_weather(request: Request, payload: RouteRequest):
+async def route_weather(
+    request: Request,
+    payload: RouteRequest,
+    services: RouteServices = Depends(route_services),
+):
     departure_iso = payload.departure_time.isoformat() if payload.departure_time else None
     cache_key = route_cache.make_key(payload.origin, payload.destination, departure_iso)
     cached = route_cache.get(cache_key)
     if cached:
-        return cached
+        return _json_response(cached)
 
     try:
-        routes_data = await get_routes(payload.origin, payload.destination)
+        routes_data = await services.get_routes(payload.origin, payload.destination)
         departure = payload.departure_time or datetime.now(timezone.utc)
 
         # Sample waypoints for each route
         all_route_waypoints = []
         for route in routes_data["routes"]:
-            waypoints = sample_route_points(route["steps"], departure)
+            waypoints = services.sample_route_points(route["steps"], departure)
             all_route_waypoints.append(waypoints)
 
         # Deduplicate weather calls across routes.
         # Routes often overlap, so many waypoints share nearly identical
-        # locations and times. Key by (lat rounded to 2dp, lng rounded to
-        # 2dp, hour) — ~1.1 km resolution, same hour.
-        unique_weather = {}  # key → waypoint (representative)
-        for waypoints in all_route_waypoints:
-            for wp in waypoints:
-                key = (
-                    round(wp.location.lat, 2),
-                    round(wp.location.lng, 2),
-                    wp.estimated_time.replace(minute=0, second=0, microsecond=0),
-                )
-                if key not in unique_weather:
-                    unique_weather[key] = wp
-
-        # Fetch weather for unique waypoints only
-        unique_list = list(unique_weather.values())
-        await get_weather_for_waypoints(unique_list)
-
-        # Build lookup and assign weather to all waypoints
-        weather_lookup = {k: wp.weather for k, wp in unique_weather.items()}
-        for waypoints in all_route_waypoints:
-            for wp in waypoints:
-                key = (
-                    round(wp.location.lat, 2),
-                    round(wp.location.lng, 2),
-                    wp.estimated_time.replace(minute=0, second=0, microsecond=0),
-                )
-                wp.weather = weather_lookup[key]
+        # locations and times. All waypoints are bucketed in one vectorized
+        # pass; np.unique yields the first waypoint of each bucket plus the
+        # bucket index of every waypoint for assigning results back.
+        flat_waypoints = [wp for waypoints in all_route_waypoints for wp in waypoints]
+        route_columns = [None] * len(all_route_waypoints)
+        if flat_waypoints:
+            _, first_index, inverse = np.unique(
+                _weather_keys(flat_waypoints),
+                axis=0,
+                return_index=True,
+                return_inverse=True,
+            )
+
+            # Fetch weather for unique waypoints only
+            unique_list = [flat_waypoints[i] for i in first_index.tolist()]
+            await services.get_weather_for_waypoints(unique_list)
+
+            # Assign each bucket's weather to all of its waypoints
+            buckets = inverse.ravel()
+            for wp, bucket in zip(flat_waypoints, buckets.tolist()):
+                wp.weather = unique_list[bucket].weather
+
+            # Pack the weather fields into arrays once for the unique
+            # waypoints, then gather each route's rows for scoring
+            unique_columns = weather_columns([wp.weather for wp in unique_list])
+            route_bounds = np.cumsum([len(w) for w in all_route_waypoints])[:-1]
+            route_columns = [
+                unique_columns.take(route_buckets)
+                for route_buckets in np.split(buckets, route_bounds)
+            ]
 
         # Build response
         route_results = []
-        for idx, (route, waypoints) in enumerate(
-            zip(routes_data["routes"], all_route_waypoints)
+        for idx, (route, waypoints, columns) in enumerate(
+            zip(routes_data["routes"], all_route_waypoints, route_columns)
         ):
-            route_results.append(
-                RouteWithWeather(
-                    route_index=idx,
-                    overview_polyline=route["overview_polyline"],
-                    summary=route["summary"],
-                    total_duration_minutes=route["total_duration_seconds"] // 60,
-                    total_distance_km=round(
-                        route["total_distance_meters"] / 1000, 1
-                    ),
-                    waypoints=waypoints,
-                )
+            route_result = RouteWithWeather(
+                route_index=idx,
+                overview_polyline=route["overview_polyline"],
+                summary=route["summary"],
+                total_duration_minutes=route["total_duration_seconds"] // 60,
+                total_distance_km=round(
+                    route["total_distance_meters"] / 1000, 1
+                ),
+                waypoints=waypoints,
             )
+            route_result._weather_columns = columns
+            route_results.append(route_result)
 
-        recommendation = await score_routes(route_results)
+        recommendation = await services.score_routes(route_results)
 
         response = MultiRouteResponse(
             origin_address=routes_data["origin_address"],
@@ -94,7 +156,7 @@ async def route_weather(request: Request, payload: RouteRequest):
             recommendation=recommendation,
         )
         route_cache.set(cache_key, response)
-        return response
+        return _json_response(response)
     except HTTPException:
         raise
     except httpx.TimeoutException:
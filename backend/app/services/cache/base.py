@@ -3,23 +3,23 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from abc import ABC, abstractmethod
 from typing import Any
 
 DEFAULT_TTL = 30 * 60  # 30 minutes
 MAX_ENTRIES = 100
+KEY_SEPARATOR = "\x1f"  # ASCII unit separator; never part of a typed address
 
 
 def make_cache_key(origin: str, destination: str, departure_time_iso: str | None) -> str:
     dt_rounded = ""
     if departure_time_iso:
         dt_rounded = departure_time_iso[:13]  # "2026-02-16T10"
-    raw = json.dumps(
-        [origin.lower().strip(), destination.lower().strip(), dt_rounded],
-        sort_keys=True,
+    raw = KEY_SEPARATOR.join(
+        (origin.lower().strip(), destination.lower().strip(), dt_rounded)
     )
-    return hashlib.sha256(raw.encode()).hexdigest()
+    # Not a security boundary: a fast 128-bit BLAKE2b digest keeps keys short
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
 
 
 class BaseRouteCache(ABC):
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from .base import BaseRouteCache, DEFAULT_TTL
 
 try:
@@ -37,19 +38,18 @@ class RedisRouteCache(BaseRouteCache):
         raw = self._client.get(key)
         if raw is None:
             return None
-        payload = raw.decode() if isinstance(raw, (bytes, bytearray)) else raw
         try:
-            data = json.loads(payload)
-            return MultiRouteResponse.model_validate(data)
+            # Validate straight from the raw bytes; no intermediate dict
+            return MultiRouteResponse.model_validate_json(raw)
         except Exception:
             logger.warning("Failed to decode cached value for key %s", key)
             return None
 
     def set(self, key: str, value: Any) -> None:
-        if hasattr(value, "model_dump"):
-            payload = json.dumps(value.model_dump(mode="json"))
+        if hasattr(value, "model_dump_json"):
+            payload = value.model_dump_json()
         else:
-            payload = json.dumps(value, default=str)
+            payload = orjson.dumps(value, default=str)
         self._client.setex(key, self._ttl, payload)
 
     def clear(self) -> None:
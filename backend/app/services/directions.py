@@ -1,16 +1,25 @@
 import logging
+from itertools import chain
+from operator import itemgetter
 
-import httpx
+import orjson
 from fastapi import HTTPException
 
 from ..config import settings
-from .http_client import request_with_retry
+from .http_client import build_client, request_with_retry
 
 logger = logging.getLogger(__name__)
 
 DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
 
-client = httpx.AsyncClient(timeout=30.0)
+client = build_client(timeout=30.0)
+
+# Field getters for the per-step extraction loop, built once
+_STEP_FIELDS = itemgetter(
+    "duration", "distance", "start_location", "end_location", "polyline"
+)
+_DURATION = itemgetter("duration_seconds")
+_DISTANCE = itemgetter("distance_meters")
 
 
 async def get_routes(origin: str, destination: str) -> dict:
@@ -29,7 +38,7 @@ async def get_routes(origin: str, destination: str) -> dict:
         },
     )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if data["status"] != "OK":
         raise HTTPException(
@@ -45,25 +54,26 @@ async def get_routes(origin: str, destination: str) -> dict:
 
     routes = []
     for route in data["routes"]:
-        steps = []
-        for leg in route["legs"]:
-            for step in leg["steps"]:
-                steps.append(
-                    {
-                        "duration_seconds": step["duration"]["value"],
-                        "distance_meters": step["distance"]["value"],
-                        "start_location": step["start_location"],
-                        "end_location": step["end_location"],
-                        "polyline": step["polyline"]["points"],
-                    }
-                )
+        # Steps of all legs (one leg per via-point) as one flat list
+        steps = [
+            {
+                "duration_seconds": duration["value"],
+                "distance_meters": distance["value"],
+                "start_location": start_location,
+                "end_location": end_location,
+                "polyline": polyline["points"],
+            }
+            for duration, distance, start_location, end_location, polyline in map(
+                _STEP_FIELDS, chain.from_iterable(leg["steps"] for leg in route["legs"])
+            )
+        ]
 
         routes.append(
             {
                 "overview_polyline": route["overview_polyline"]["points"],
                 "summary": route.get("summary", ""),
-                "total_duration_seconds": sum(s["duration_seconds"] for s in steps),
-                "total_distance_meters": sum(s["distance_meters"] for s in steps),
+                "total_duration_seconds": sum(map(_DURATION, steps)),
+                "total_distance_meters": sum(map(_DISTANCE, steps)),
                 "steps": steps,
             }
         )
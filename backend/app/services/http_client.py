@@ -6,8 +6,30 @@ import asyncio
 
 import httpx
 
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+
+    HTTP2_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 BACKOFF_SCHEDULE_SECONDS = (0.2, 0.5)
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+
+def build_client(timeout: float) -> httpx.AsyncClient:
+    """Create a long-lived AsyncClient with keep-alive pooling and HTTP/2.
+
+    Clients are meant to be created once at module scope and shared across
+    requests so TCP/TLS connections are reused; they are closed in the app
+    lifespan.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=HTTP2_AVAILABLE,
+        limits=CONNECTION_LIMITS,
+    )
 
 
 def _is_retryable_exception(exc: Exception) -> bool:
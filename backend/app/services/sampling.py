@@ -1,26 +1,79 @@
 from datetime import datetime, timedelta
-from math import atan2, cos, radians, sin, sqrt
+from math import floor
 
-import polyline as polyline_codec
+import numpy as np
 
 from ..models import LatLng, Waypoint
 
 INTERVAL_SECONDS = 15 * 60  # 15 minutes
+EARTH_RADIUS_M = 6_371_000
+
+
+def _segment_distances(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """Haversine length in meters of each consecutive segment of a polyline.
+
+    Radians and cos(lat) are computed once per vertex and shared by the
+    two segments meeting there.
+    """
+    lat_rad = np.radians(lats)
+    lng_rad = np.radians(lngs)
+    cos_lat = np.cos(lat_rad)
+    dlat = np.diff(lat_rad)
+    dlon = np.diff(lng_rad)
+    a = np.sin(dlat / 2) ** 2 + cos_lat[:-1] * cos_lat[1:] * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
 
 def _haversine(p1: tuple, p2: tuple) -> float:
     """Distance in meters between two (lat, lng) tuples."""
-    R = 6_371_000
-    lat1, lon1 = radians(p1[0]), radians(p1[1])
-    lat2, lon2 = radians(p2[0]), radians(p2[1])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-    return R * 2 * atan2(sqrt(a), sqrt(1 - a))
+    return float(_segment_distances(np.array([p1[0], p2[0]]), np.array([p1[1], p2[1]]))[0])
+
+
+def _decode_polylines(encoded: list[str]) -> list[np.ndarray]:
+    """Decode Google encoded polylines into (N, 2) arrays of (lat, lng).
+
+    Vectorized equivalent of ``polyline.decode`` that handles all strings in
+    one pass: every character carries a 5-bit chunk, and a chunk without the
+    0x20 continuation bit ends a value. Each polyline starts from absolute
+    coordinates, so the running sum is re-based at every polyline boundary.
+    """
+    joined = "".join(encoded)
+    chunks = np.frombuffer(joined.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+    ends = np.flatnonzero(chunks < 0x20)
+    if ends.size == 0:
+        return [np.empty((0, 2), dtype=np.float64) for _ in encoded]
+    chunks = chunks[: ends[-1] + 1]
+
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    value_index = np.repeat(np.arange(ends.size), ends - starts + 1)
+    shifts = 5 * (np.arange(chunks.size) - starts[value_index])
+    values = np.add.reduceat((chunks & 0x1F) << shifts, starts)
+
+    # Zig-zag decode, then accumulate the per-point deltas
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1).reshape(-1, 2)
+    totals = np.cumsum(deltas, axis=0)
+
+    # Assign each point to its source string by the offset of its last char
+    string_ends = np.cumsum([len(e) for e in encoded])
+    counts = np.bincount(
+        np.searchsorted(string_ends, ends[1::2], side="right"),
+        minlength=len(encoded),
+    )
+    first_points = np.cumsum(counts) - counts
+    bases = np.zeros((len(encoded), 2), dtype=np.int64)
+    has_prior = first_points > 0
+    bases[has_prior] = totals[first_points[has_prior] - 1]
+    coords = (totals - np.repeat(bases, counts, axis=0)) / 1e5
+
+    return np.split(coords, np.cumsum(counts)[:-1])
 
 
 def _interpolate(p1: tuple, p2: tuple, fraction: float) -> tuple:
-    """Linear interpolation between two (lat, lng) tuples."""
+    """Linear interpolation between two (lat, lng) tuples.
+
+    Components and *fraction* may be NumPy arrays, to interpolate many
+    points at once.
+    """
     return (
         p1[0] + (p2[0] - p1[0]) * fraction,
         p1[1] + (p2[1] - p1[1]) * fraction,
@@ -33,9 +86,14 @@ def sample_route_points(
 ) -> list[Waypoint]:
     """Sample waypoints along the route at 15-minute intervals.
 
-    Walks through each step's decoded polyline, tracking cumulative elapsed
-    time. When a 15-minute boundary is crossed, the exact position is
-    interpolated within that polyline segment.
+    Each step's decoded polyline is processed as arrays: segment distances
+    and cumulative elapsed times are computed in one pass, then every
+    15-minute boundary falling inside the step is located with
+    ``np.searchsorted`` and its exact position interpolated within the
+    containing polyline segment.
+
+    Waypoints are built with ``model_construct``: every field comes from
+    already-typed internal values, so pydantic validation is skipped.
     """
     if not steps:
         return []
@@ -43,8 +101,8 @@ def sample_route_points(
     # Always include the starting point
     first_step = steps[0]
     waypoints = [
-        Waypoint(
-            location=LatLng(
+        Waypoint.model_construct(
+            location=LatLng.model_construct(
                 lat=first_step["start_location"]["lat"],
                 lng=first_step["start_location"]["lng"],
             ),
@@ -55,8 +113,9 @@ def sample_route_points(
 
     elapsed_seconds = 0.0
     next_threshold = INTERVAL_SECONDS
+    decoded_steps = _decode_polylines([step["polyline"] for step in steps])
 
-    for step in steps:
+    for step, step_points in zip(steps, decoded_steps):
         step_duration = step["duration_seconds"]
         step_distance = step["distance_meters"]
 
@@ -65,47 +124,69 @@ def sample_route_points(
             continue
 
         speed_mps = step_distance / step_duration
-        step_points = polyline_codec.decode(step["polyline"])
-
-        for i in range(len(step_points) - 1):
-            p1 = step_points[i]
-            p2 = step_points[i + 1]
-            segment_distance = _haversine(p1, p2)
-            segment_duration = segment_distance / speed_mps if speed_mps > 0 else 0
-
-            segment_end_elapsed = elapsed_seconds + segment_duration
-
-            while next_threshold <= segment_end_elapsed:
-                time_into_segment = next_threshold - elapsed_seconds
-                fraction = (
-                    time_into_segment / segment_duration
-                    if segment_duration > 0
-                    else 0
-                )
-                fraction = max(0.0, min(1.0, fraction))
+        if len(step_points) < 2:
+            continue
 
-                point = _interpolate(p1, p2, fraction)
-                minutes = int(next_threshold // 60)
+        lats = step_points[:, 0]
+        lngs = step_points[:, 1]
+        segment_distances = _segment_distances(lats, lngs)
+        segment_durations = (
+            segment_distances / speed_mps
+            if speed_mps > 0
+            else np.zeros_like(segment_distances)
+        )
+
+        # Elapsed time at each polyline vertex; segment i spans
+        # boundaries[i]..boundaries[i + 1].
+        boundaries = np.cumsum(
+            np.concatenate(([elapsed_seconds], segment_durations))
+        )
+        step_end_elapsed = float(boundaries[-1])
+
+        if next_threshold <= step_end_elapsed:
+            thresholds = np.arange(
+                next_threshold, floor(step_end_elapsed) + 1, INTERVAL_SECONDS
+            )
+            # First segment whose end reaches each threshold
+            seg_idx = np.searchsorted(boundaries[1:], thresholds, side="left")
+            seg_durations = segment_durations[seg_idx]
+            time_into_segment = thresholds - boundaries[seg_idx]
+            fractions = np.divide(
+                time_into_segment,
+                seg_durations,
+                out=np.zeros_like(seg_durations),
+                where=seg_durations > 0,
+            )
+            fractions = np.clip(fractions, 0.0, 1.0)
+
+            point_lats, point_lngs = _interpolate(
+                (lats[seg_idx], lngs[seg_idx]),
+                (lats[seg_idx + 1], lngs[seg_idx + 1]),
+                fractions,
+            )
 
+            for threshold, lat, lng in zip(
+                thresholds.tolist(), point_lats.tolist(), point_lngs.tolist()
+            ):
                 waypoints.append(
-                    Waypoint(
-                        location=LatLng(lat=point[0], lng=point[1]),
-                        minutes_from_start=minutes,
+                    Waypoint.model_construct(
+                        location=LatLng.model_construct(lat=lat, lng=lng),
+                        minutes_from_start=int(threshold // 60),
                         estimated_time=departure_time
-                        + timedelta(seconds=next_threshold),
+                        + timedelta(seconds=threshold),
                     )
                 )
-                next_threshold += INTERVAL_SECONDS
+            next_threshold = int(thresholds[-1]) + INTERVAL_SECONDS
 
-            elapsed_seconds = segment_end_elapsed
+        elapsed_seconds = step_end_elapsed
 
     # Always include the ending point
     last_step = steps[-1]
     total_minutes = int(elapsed_seconds // 60)
     if not waypoints or waypoints[-1].minutes_from_start != total_minutes:
         waypoints.append(
-            Waypoint(
-                location=LatLng(
+            Waypoint.model_construct(
+                location=LatLng.model_construct(
                     lat=last_step["end_location"]["lat"],
                     lng=last_step["end_location"]["lng"],
                 ),
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from bisect import bisect_right
+from math import floor
 from pathlib import Path
+from typing import NamedTuple
 
-import httpx
 import joblib
 import numpy as np
+import orjson
 
 from ..config import settings
 from ..models import (
@@ -19,12 +22,34 @@ from ..models import (
     WeatherAdvisory,
     WeatherData,
 )
+from .cache.memory import TTLCache
+from .http_client import build_client
+
+try:
+    import onnxruntime
+except ModuleNotFoundError:  # pragma: no cover
+    onnxruntime = None
 
 logger = logging.getLogger(__name__)
 
 GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
-geocode_client = httpx.AsyncClient(timeout=10.0)
+geocode_client = build_client(timeout=10.0)
+
+# Place names for ~1.1 km cells barely change, so successful lookups are
+# kept for a week and shared across requests.
+GEOCODE_CACHE_TTL = 7 * 24 * 3600
+GEOCODE_CACHE_MAX_ENTRIES = 10_000
+
+_geocode_cache = TTLCache(ttl=GEOCODE_CACHE_TTL, max_entries=GEOCODE_CACHE_MAX_ENTRIES)
+
+# Recommendations are reused for identical scoring inputs (e.g. differently
+# worded searches that resolve to the same routes and forecasts), skipping
+# model inference and geocoding. Kept as long as the forecasts they use.
+SCORE_CACHE_TTL = 30 * 60
+SCORE_CACHE_MAX_ENTRIES = 1_000
+
+_score_cache = TTLCache(ttl=SCORE_CACHE_TTL, max_entries=SCORE_CACHE_MAX_ENTRIES)
 
 # ---------------------------------------------------------------------------
 # WMO code → severity (0.0 = benign, 1.0 = extreme)
@@ -60,54 +85,170 @@ WMO_SEVERITY: dict[int, float] = {
     99: 1.0,
 }
 
+UNKNOWN_SEVERITY = 0.5
+ADVERSE_WEATHER_CODE = 61  # codes at or above this count as adverse
+
+# Severity lookup table indexed by WMO code, built once at import time.
+# Every code outside WMO_SEVERITY (including the padding up to 128) maps
+# to UNKNOWN_SEVERITY.
+_SEVERITY_LUT = np.full(128, UNKNOWN_SEVERITY, dtype=np.float32)
+for _code, _severity in WMO_SEVERITY.items():
+    _SEVERITY_LUT[_code] = _severity
+del _code, _severity
+
+
+def _severity_of(codes: np.ndarray) -> np.ndarray:
+    """Vectorized ``WMO_SEVERITY.get(code, UNKNOWN_SEVERITY)`` over codes."""
+    in_range = (codes >= 0) & (codes < _SEVERITY_LUT.size)
+    return np.where(
+        in_range, _SEVERITY_LUT[np.where(in_range, codes, 0)], UNKNOWN_SEVERITY
+    )
+
+
 # ---------------------------------------------------------------------------
 # Load the pre-trained model once at import time
 # ---------------------------------------------------------------------------
 _MODEL_PATH = Path(__file__).resolve().parent.parent / "ml" / "route_model.joblib"
-try:
-    _model = joblib.load(_MODEL_PATH)
-except FileNotFoundError:
-    raise RuntimeError(
-        f"ML model not found at {_MODEL_PATH}. Run: python -m app.ml.train_model"
-    )
+_ONNX_MODEL_PATH = _MODEL_PATH.with_suffix(".onnx")
+
+N_FEATURES = 9
+
+
+class _OnnxModel:
+    """Minimal ``predict`` wrapper around an ONNX Runtime inference session."""
+
+    def __init__(self, path: Path):
+        # Batches are a handful of rows; a single intra-op thread avoids
+        # thread-pool wake-ups and oversubscribing the server's workers.
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            str(path), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_name = self._session.get_inputs()[0].name
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        outputs = self._session.run(
+            None, {self._input_name: np.asarray(X, dtype=np.float32)}
+        )
+        return outputs[0].ravel()
+
+
+def _load_model():
+    """Prefer the ONNX export; fall back to the joblib-pickled estimator.
+
+    The model runs one dummy prediction before it is returned, so lazy
+    initialisation happens at import rather than on the first request.
+    """
+    if onnxruntime is not None and _ONNX_MODEL_PATH.is_file():
+        model = _OnnxModel(_ONNX_MODEL_PATH)
+    else:
+        try:
+            model = joblib.load(_MODEL_PATH)
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"ML model not found at {_MODEL_PATH}. Run: python -m app.ml.train_model"
+            )
+    model.predict(np.zeros((1, N_FEATURES), dtype=np.float32))
+    return model
+
+
+_model = _load_model()
 
 
 # ---------------------------------------------------------------------------
 # Feature extraction
 # ---------------------------------------------------------------------------
 
-def _weather_list(waypoints: list[Waypoint]) -> list[WeatherData]:
-    return [wp.weather for wp in waypoints if wp.weather is not None]
 
+class WeatherColumns(NamedTuple):
+    """Weather fields of a sequence of waypoints as parallel arrays.
+
+    ``present`` marks the waypoints that have weather; the other columns
+    hold zeros at the remaining positions.
+    """
+
+    present: np.ndarray
+    codes: np.ndarray
+    wind: np.ndarray
+    precip: np.ndarray
+    precip_prob: np.ndarray
+
+    def take(self, indices: np.ndarray) -> WeatherColumns:
+        """Columns for the waypoints at *indices*, in that order."""
+        return WeatherColumns(*(column[indices] for column in self))
+
+
+def weather_columns(weathers: list[WeatherData | None]) -> WeatherColumns:
+    """Pack per-waypoint weather (``None`` when missing) into columns."""
+    count = len(weathers)
+    present = np.fromiter((w is not None for w in weathers), dtype=bool, count=count)
+    available = [w for w in weathers if w is not None]
+    columns = WeatherColumns(
+        present,
+        np.zeros(count, dtype=np.int64),
+        np.zeros(count),
+        np.zeros(count),
+        np.zeros(count),
+    )
+    if available:
+        n = len(available)
+        columns.codes[present] = np.fromiter((w.weather_code for w in available), np.int64, n)
+        columns.wind[present] = np.fromiter((w.wind_speed_kmh for w in available), float, n)
+        columns.precip[present] = np.fromiter((w.precipitation_mm for w in available), float, n)
+        columns.precip_prob[present] = np.fromiter(
+            (w.precipitation_probability for w in available), float, n
+        )
+    return columns
+
+
+def _route_weather_columns(route: RouteWithWeather) -> WeatherColumns:
+    """Columns attached to the route by the request handler, else built here."""
+    columns = route._weather_columns
+    if columns is None:
+        columns = weather_columns([wp.weather for wp in route.waypoints])
+    return columns
 
-def extract_features(route: RouteWithWeather, min_duration: int) -> list[float]:
-    """Extract the 9-element feature vector expected by the ML model."""
-    weathers = _weather_list(route.waypoints)
 
-    if not weathers:
+def extract_features(
+    route: RouteWithWeather,
+    min_duration: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Extract the 9-element feature vector expected by the ML model.
+
+    Weather fields are read from the route's ``WeatherColumns``, so every
+    aggregate is a single NumPy reduction instead of a Python-level pass.
+    When *out* is given (e.g. a row of the feature matrix) the features are
+    written into it in place and it is returned.
+    """
+    features = np.zeros(N_FEATURES) if out is None else out
+    features.fill(0.0)
+    features[0] = route.total_duration_minutes / max(min_duration, 1)  # duration_ratio
+
+    columns = _route_weather_columns(route)
+    if not columns.present.any():
         # No weather data — assume neutral conditions
-        return [
-            route.total_duration_minutes / max(min_duration, 1),
-            0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
-        ]
-
-    severities = [WMO_SEVERITY.get(w.weather_code, 0.5) for w in weathers]
-    wind_speeds = [w.wind_speed_kmh for w in weathers]
-    precips = [w.precipitation_mm for w in weathers]
-    precip_probs = [w.precipitation_probability for w in weathers]
-    adverse_count = sum(1 for w in weathers if w.weather_code >= 61)
-
-    return [
-        route.total_duration_minutes / max(min_duration, 1),   # duration_ratio
-        sum(severities) / len(severities),                      # avg_weather_severity
-        max(severities),                                        # max_weather_severity
-        sum(wind_speeds) / len(wind_speeds),                    # avg_wind_speed
-        max(wind_speeds),                                       # max_wind_speed
-        sum(precips) / len(precips),                            # avg_precipitation
-        max(precips),                                           # max_precipitation
-        adverse_count / len(weathers),                          # pct_adverse_waypoints
-        sum(precip_probs) / len(precip_probs),                  # avg_precip_probability
-    ]
+        return features
+
+    present = columns.present
+    codes = columns.codes[present]
+    # One row per aggregated quantity, so all means and all maxima are each
+    # a single reduction over the waypoint axis
+    stats = np.vstack((
+        _severity_of(codes),                 # weather severity
+        columns.wind[present],               # wind speed
+        columns.precip[present],             # precipitation
+        codes >= ADVERSE_WEATHER_CODE,       # adverse waypoint
+        columns.precip_prob[present],        # precipitation probability
+    ))
+    # avg_weather_severity, avg_wind_speed, avg_precipitation,
+    # pct_adverse_waypoints, avg_precip_probability
+    features[[1, 3, 5, 7, 8]] = stats.mean(axis=1)
+    # max_weather_severity, max_wind_speed, max_precipitation
+    features[[2, 4, 6]] = stats[:3].max(axis=1)
+    return features
 
 
 # ---------------------------------------------------------------------------
@@ -121,26 +262,37 @@ def _format_coords(lat: float, lng: float) -> str:
     return f"{abs(lat):.1f}\u00b0{ns}, {abs(lng):.1f}\u00b0{ew}"
 
 
+def _geocode_cell(lat: float, lng: float) -> tuple[int, int]:
+    """Integer 0.01° grid cell of a coordinate, used to dedup lookups."""
+    return floor(lat * 100), floor(lng * 100)
+
+
 async def _reverse_geocode_batch(
     coords: list[tuple[float, float]],
 ) -> dict[tuple[float, float], str]:
     """Reverse-geocode a list of (lat, lng) pairs to 'Town, State' strings.
 
-    Deduplicates by rounding to 2 decimal places (~1.1 km).
+    Deduplicates by 0.01° grid cell (~1.1 km). Cells resolved
+    by an earlier request are served from ``_geocode_cache``; only the
+    misses hit the Geocoding API.
     Falls back to formatted coordinates when geocoding fails.
     """
-    # Deduplicate by rounded coords
-    unique: dict[tuple[float, float], tuple[float, float]] = {}
+    # Deduplicate by 0.01° grid cell (floored, see _geocode_cell)
+    unique: dict[tuple[int, int], tuple[float, float]] = {}
     for lat, lng in coords:
-        key = (round(lat, 2), round(lng, 2))
+        key = _geocode_cell(lat, lng)
         if key not in unique:
             unique[key] = (lat, lng)
 
-    results: dict[tuple[float, float], str] = {}
+    results: dict[tuple[int, int], str] = {}
 
     tasks = []
     keys = []
     for key, (lat, lng) in unique.items():
+        cached = _geocode_cache.get(key)
+        if cached is not None:
+            results[key] = cached
+            continue
         keys.append(key)
         tasks.append(
             geocode_client.get(
@@ -160,7 +312,7 @@ async def _reverse_geocode_batch(
         if isinstance(resp, Exception):
             results[key] = fallback
             continue
-        data = resp.json()
+        data = orjson.loads(resp.content)
         if data.get("status") == "OK" and data.get("results"):
             components = data["results"][0].get("address_components", [])
             town = ""
@@ -190,13 +342,15 @@ async def _reverse_geocode_batch(
                 results[key] = data["results"][0].get(
                     "formatted_address", fallback
                 )
+            # Only successful lookups are cached; failures are retried
+            _geocode_cache.set(key, results[key])
         else:
             results[key] = fallback
 
-    # Map original coords to results via their rounded key
+    # Map original coords to results via their grid cell
     full_results: dict[tuple[float, float], str] = {}
     for lat, lng in coords:
-        key = (round(lat, 2), round(lng, 2))
+        key = _geocode_cell(lat, lng)
         full_results[(lat, lng)] = results.get(key, _format_coords(lat, lng))
 
     return full_results
@@ -206,140 +360,187 @@ async def _reverse_geocode_batch(
 # Advisory generation (rule-based)
 # ---------------------------------------------------------------------------
 
-def _check_advisory_conditions(
-    wp: Waypoint,
-) -> list[tuple[str, str, str]]:
-    """Return list of (type, severity, message_template) for a single waypoint."""
-    w = wp.weather
-    if w is None:
-        return []
+# (type, severity, message_template), one per column of _advisory_matrix.
+# Templates are filled in one pass, once the triggering waypoint's location
+# is known, with its {wind} speed and a {where} phrase: "near <place>" when
+# reverse-geocoded, otherwise how far into the drive it is.
+_ADVISORY_RULES: tuple[tuple[str, str, str], ...] = (
+    ("heavy_rain", "danger", "Heavy rain expected {where}"),
+    ("moderate_rain", "warning", "Moderate rain expected {where}"),
+    ("freezing_rain", "danger", "Freezing rain/drizzle {where} \u2014 road ice likely"),
+    ("heavy_snow", "danger", "Heavy snow expected {where}"),
+    ("snow", "warning", "Snow expected {where}"),
+    ("high_wind", "danger", "Dangerous winds ({wind:.0f} km/h) {where}"),
+    ("high_wind", "warning", "Strong winds ({wind:.0f} km/h) {where}"),
+    ("thunderstorm", "danger", "Thunderstorm expected {where}"),
+    ("hail", "danger", "Thunderstorm with hail {where}"),
+    ("fog", "warning", "Fog {where} \u2014 reduced visibility"),
+)
 
-    triggered: list[tuple[str, str, str]] = []
-
-    checks: list[tuple[str, str, bool, str]] = [
-        (
-            "heavy_rain", "danger",
-            w.weather_code in (65, 82) or w.precipitation_mm >= 7.5,
-            "Heavy rain expected near {loc}",
-        ),
-        (
-            "moderate_rain", "warning",
-            w.weather_code in (63, 81) or (4.0 <= w.precipitation_mm < 7.5),
-            "Moderate rain expected near {loc}",
-        ),
-        (
-            "freezing_rain", "danger",
-            w.weather_code in (56, 57, 66, 67),
-            "Freezing rain/drizzle near {loc} \u2014 road ice likely",
-        ),
-        (
-            "heavy_snow", "danger",
-            w.weather_code in (73, 75, 86),
-            "Heavy snow expected near {loc}",
-        ),
-        (
-            "snow", "warning",
-            w.weather_code in (71, 77, 85),
-            "Snow expected near {loc}",
-        ),
-        (
-            "high_wind", "danger",
-            w.wind_speed_kmh >= 75,
-            f"Dangerous winds ({round(w.wind_speed_kmh)} km/h) near {{loc}}",
-        ),
-        (
-            "high_wind", "warning",
-            50 <= w.wind_speed_kmh < 75,
-            f"Strong winds ({round(w.wind_speed_kmh)} km/h) near {{loc}}",
-        ),
-        (
-            "thunderstorm", "danger",
-            w.weather_code == 95,
-            "Thunderstorm expected near {loc}",
-        ),
-        (
-            "hail", "danger",
-            w.weather_code in (96, 99),
-            "Thunderstorm with hail near {loc}",
-        ),
-        (
-            "fog", "warning",
-            w.weather_code in (45, 48),
-            "Fog near {loc} \u2014 reduced visibility",
-        ),
-    ]
 
-    for adv_type, severity, condition, template in checks:
-        if condition:
-            triggered.append((adv_type, severity, template))
+_SEVERITY_RANK = {"danger": 0, "warning": 1}
+
+# Rule indices in display order (danger first, then by type), so advisories
+# come out of _pending_advisories already sorted.
+_DISPLAY_ORDER = np.array(sorted(
+    range(len(_ADVISORY_RULES)),
+    key=lambda i: (_SEVERITY_RANK[_ADVISORY_RULES[i][1]], _ADVISORY_RULES[i][0]),
+))
+
+
+# WMO codes that trigger each rule on their own, in _ADVISORY_RULES order;
+# the rain and wind rules also have threshold conditions (_advisory_matrix).
+_RULE_CODES: tuple[tuple[int, ...], ...] = (
+    (65, 82),            # heavy_rain
+    (63, 81),            # moderate_rain
+    (56, 57, 66, 67),    # freezing_rain
+    (73, 75, 86),        # heavy_snow
+    (71, 77, 85),        # snow
+    (),                  # high_wind danger
+    (),                  # high_wind warning
+    (95,),               # thunderstorm
+    (96, 99),            # hail
+    (45, 48),            # fog
+)
 
-    return triggered
+# Code-triggered rules as a lookup table indexed by WMO code, built once at
+# import time. Row 0 (clear sky) triggers nothing, so out-of-range codes are
+# looked up there.
+_CODE_RULES = np.zeros((128, len(_ADVISORY_RULES)), dtype=bool)
+for _rule, _codes in enumerate(_RULE_CODES):
+    _CODE_RULES[list(_codes), _rule] = True
+del _rule, _codes
+
+
+def _advisory_matrix(
+    codes: np.ndarray, wind: np.ndarray, precip: np.ndarray
+) -> np.ndarray:
+    """(N, len(_ADVISORY_RULES)) boolean matrix of the rules each entry triggers."""
+    in_range = (codes >= 0) & (codes < len(_CODE_RULES))
+    matrix = _CODE_RULES[np.where(in_range, codes, 0)]  # fancy indexing copies
+    matrix[:, 0] |= precip >= 7.5                       # heavy_rain
+    matrix[:, 1] |= (precip >= 4.0) & (precip < 7.5)    # moderate_rain
+    matrix[:, 5] = wind >= 75                           # high_wind danger
+    matrix[:, 6] = (wind >= 50) & (wind < 75)           # high_wind warning
+    return matrix
+
+
+class PendingAdvisory(NamedTuple):
+    """A triggered advisory and the waypoint it is reported at."""
+
+    type: str
+    severity: str
+    template: str
+    wind_speed_kmh: float
+    lat: float
+    lng: float
+    minutes_from_start: int
+
+
+def _needs_geocoding(advisory: PendingAdvisory) -> bool:
+    """Whether ``settings.advisory_geocode_mode`` names a place for *advisory*."""
+    mode = settings.advisory_geocode_mode
+    return mode == "all" or (mode == "danger" and advisory.severity == "danger")
+
+
+def _pending_advisories(
+    waypoints: list[Waypoint],
+    columns: WeatherColumns | None = None,
+) -> list[PendingAdvisory]:
+    """Find the advisories a route triggers, before any location lookup.
+
+    All rules are evaluated over all waypoints at once into one boolean
+    matrix; ``any`` over each column says which rules fired and ``argmax``
+    gives the first waypoint that triggered each, where it is reported.
+    Advisories are returned in display order, most severe first.
+    *columns* are the waypoints' ``WeatherColumns`` when already built.
+    """
+    if columns is None:
+        columns = weather_columns([wp.weather for wp in waypoints])
+    weathered = np.flatnonzero(columns.present)
+    if weathered.size == 0:
+        return []
 
+    wind = columns.wind[weathered]
+    matrix = _advisory_matrix(columns.codes[weathered], wind, columns.precip[weathered])
+    triggered = matrix.any(axis=0)
+    first = matrix.argmax(axis=0)
 
-async def _collect_advisories(waypoints: list[Waypoint]) -> list[WeatherAdvisory]:
-    """Generate weather advisories with location names for a route's waypoints."""
-    # First pass: find which waypoints trigger advisories (dedup by type+severity)
-    seen: set[tuple[str, str]] = set()
-    pending: list[tuple[str, str, str, float, float]] = []  # type, severity, template, lat, lng
+    pending: list[PendingAdvisory] = []
+    for rule in _DISPLAY_ORDER[triggered[_DISPLAY_ORDER]].tolist():
+        adv_type, severity, template = _ADVISORY_RULES[rule]
+        idx = int(first[rule])
+        wp = waypoints[weathered[idx]]
+        pending.append(PendingAdvisory(
+            adv_type, severity, template, float(wind[idx]),
+            wp.location.lat, wp.location.lng, wp.minutes_from_start,
+        ))
 
-    for wp in waypoints:
-        triggered = _check_advisory_conditions(wp)
-        for adv_type, severity, template in triggered:
-            if (adv_type, severity) not in seen:
-                seen.add((adv_type, severity))
-                pending.append((
-                    adv_type, severity, template,
-                    wp.location.lat, wp.location.lng,
-                ))
+    return pending
 
-    if not pending:
-        return []
 
-    # Batch reverse-geocode all advisory locations
-    coords = [(lat, lng) for _, _, _, lat, lng in pending]
-    location_names = await _reverse_geocode_batch(coords)
+def _build_advisories(
+    pending: list[PendingAdvisory],
+    location_names: dict[tuple[float, float], str],
+) -> list[WeatherAdvisory]:
+    """Render pending advisories, keeping their (most severe first) order.
 
-    # Build advisories with resolved location names
+    Advisories whose location was resolved are placed "near" it; the rest
+    say how far into the drive they occur.
+    """
     advisories: list[WeatherAdvisory] = []
-    for adv_type, severity, template, lat, lng in pending:
-        loc_name = location_names.get((lat, lng), "unknown location")
-        message = template.format(loc=loc_name)
+    for adv_type, severity, template, wind, lat, lng, minutes in pending:
+        loc_name = location_names.get((lat, lng))
+        where = f"near {loc_name}" if loc_name else f"~{minutes} min into the drive"
+        message = template.format(where=where, wind=wind)
         advisories.append(
             WeatherAdvisory(type=adv_type, severity=severity, message=message)
         )
-
-    advisories.sort(key=lambda a: (0 if a.severity == "danger" else 1, a.type))
     return advisories
 
 
+async def _resolve_locations(
+    coords: list[tuple[float, float]],
+) -> dict[tuple[float, float], str]:
+    """Reverse-geocode advisory coordinates, never failing the whole request."""
+    if not coords:
+        return {}
+    try:
+        return await _reverse_geocode_batch(coords)
+    except Exception as exc:
+        logger.warning("Reverse geocoding failed: %s", exc)
+        return {coord: _format_coords(*coord) for coord in coords}
+
+
 # ---------------------------------------------------------------------------
 # Reason text
 # ---------------------------------------------------------------------------
 
+# Weather phrase per score band: below 40, 40-60, 60-80, and 80 and above
+_WEATHER_BANDS = (40, 60, 80)
+_WEATHER_PHRASES = (
+    "poor weather conditions",
+    "some adverse weather",
+    "fair weather conditions",
+    "mostly clear weather",
+)
+
+
 def _generate_reason(
     route: RouteWithWeather,
     duration_score: float,
     weather_score: float,
     min_duration: int,
 ) -> str:
-    parts: list[str] = []
-
     if route.total_duration_minutes <= min_duration:
-        parts.append("Fastest route")
+        duration_part = "Fastest route"
     else:
         extra = route.total_duration_minutes - min_duration
-        parts.append(f"{extra} min longer than fastest")
-
-    if weather_score >= 80:
-        parts.append("mostly clear weather")
-    elif weather_score >= 60:
-        parts.append("fair weather conditions")
-    elif weather_score >= 40:
-        parts.append("some adverse weather")
-    else:
-        parts.append("poor weather conditions")
+        duration_part = f"{extra} min longer than fastest"
 
-    return " with ".join(parts) if len(parts) == 2 else parts[0]
+    weather_part = _WEATHER_PHRASES[bisect_right(_WEATHER_BANDS, weather_score)]
+
+    return " with ".join((duration_part, weather_part))
 
 
 # ---------------------------------------------------------------------------
@@ -353,23 +554,55 @@ async def score_routes(routes: list[RouteWithWeather]) -> RouteRecommendation:
 
     min_duration = min(r.total_duration_minutes for r in routes)
 
-    # Extract features and predict
-    feature_matrix = np.array(
-        [extract_features(r, min_duration) for r in routes]
+    # Extract features into a preallocated float32 matrix
+    feature_matrix = np.empty((len(routes), N_FEATURES), dtype=np.float32)
+    for idx, route in enumerate(routes):
+        extract_features(route, min_duration, out=feature_matrix[idx])
+
+    # Find advisories for every route, then resolve the locations that
+    # settings.advisory_geocode_mode asks for in one reverse-geocoding batch
+    # (alternate routes often trigger at the same places).
+    pending_by_route = [
+        _pending_advisories(r.waypoints, _route_weather_columns(r)) for r in routes
+    ]
+    coords = list(dict.fromkeys(
+        (advisory.lat, advisory.lng)
+        for pending in pending_by_route
+        for advisory in pending
+        if _needs_geocoding(advisory)
+    ))
+
+    # Everything the recommendation depends on: features, the advisories'
+    # triggers and waypoints, which of them get a place name, and the raw
+    # durations and indices used for the reason text and the best route.
+    cache_key = (
+        feature_matrix.tobytes(),
+        tuple((r.route_index, r.total_duration_minutes) for r in routes),
+        tuple(tuple(pending) for pending in pending_by_route),
+        tuple(coords),
     )
-    predicted_scores = _model.predict(feature_matrix)
-    predicted_scores = np.clip(predicted_scores, 0, 100)
-
-    # Collect advisories for all routes in parallel (includes reverse geocoding)
-    advisory_tasks = [_collect_advisories(r.waypoints) for r in routes]
-    all_advisories_raw = await asyncio.gather(*advisory_tasks, return_exceptions=True)
-    all_advisories = []
-    for a in all_advisories_raw:
-        if isinstance(a, list):
-            all_advisories.append(a)
-        else:
-            logger.warning("Advisory collection failed: %s", a)
-            all_advisories.append([])
+    cached = _score_cache.get(cache_key)
+    if cached is not None:
+        # Callers own what they get back; the cached copy stays untouched
+        return cached.model_copy(deep=True)
+
+    # Prediction runs in the default executor so the event loop keeps
+    # serving the geocoding round-trips (and other requests) meanwhile.
+    # Geocoding is cancelled if prediction fails.
+    loop = asyncio.get_running_loop()
+    geocoding = asyncio.create_task(_resolve_locations(coords))
+    try:
+        predicted_scores = await loop.run_in_executor(None, _model.predict, feature_matrix)
+    except BaseException:
+        geocoding.cancel()
+        raise
+    location_names = await geocoding
+    predicted_scores = np.asarray(predicted_scores)
+    np.clip(predicted_scores, 0, 100, out=predicted_scores)
+
+    all_advisories = [
+        _build_advisories(pending, location_names) for pending in pending_by_route
+    ]
 
     # Compute sub-scores for the UI
     scores: list[RouteScore] = []
@@ -394,8 +627,13 @@ async def score_routes(routes: list[RouteWithWeather]) -> RouteRecommendation:
 
     best_idx = int(np.argmax(predicted_scores))
 
-    return RouteRecommendation(
+    recommendation = RouteRecommendation(
         recommended_route_index=routes[best_idx].route_index,
         scores=scores,
         advisories=list(all_advisories),
     )
+    # Names that fell back to coordinates are retried next time, as in the
+    # geocode cache, so such recommendations are not kept
+    if all(location_names.get(coord) != _format_coords(*coord) for coord in coords):
+        _score_cache.set(cache_key, recommendation.model_copy(deep=True))
+    return recommendation
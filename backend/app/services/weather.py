@@ -1,11 +1,14 @@
 import asyncio
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from math import floor
 
 import httpx
+import orjson
 
 from ..models import Waypoint, WeatherData
-from .http_client import request_with_retry
+from .cache.memory import TTLCache
+from .http_client import build_client, request_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -48,46 +51,24 @@ WMO_CODES = {
     99: "Thunderstorm with heavy hail",
 }
 
+# Descriptions indexed by WMO code (codes run 0-99), built once at import
+# time; codes missing from WMO_CODES read "Unknown".
+_WMO_DESCRIPTIONS: tuple[str, ...] = tuple(WMO_CODES.get(code, "Unknown") for code in range(128))
 
-_semaphore = asyncio.Semaphore(5)
 
+# Open-Meteo accepts comma-separated coordinate lists; cap each request so
+# the query string stays well within URL length limits.
+MAX_LOCATIONS_PER_REQUEST = 50
 
-async def _fetch_weather_for_point(
-    client: httpx.AsyncClient,
-    lat: float,
-    lng: float,
-    target_time: datetime,
-) -> WeatherData:
-    """Fetch hourly forecast for a single point and extract the closest hour."""
-    date_str = target_time.strftime("%Y-%m-%d")
-    async with _semaphore:
-        response = await request_with_retry(
-            client,
-            "GET",
-            OPEN_METEO_URL,
-            params={
-                "latitude": round(lat, 4),
-                "longitude": round(lng, 4),
-                "hourly": ",".join(HOURLY_PARAMS),
-                "start_date": date_str,
-                "end_date": date_str,
-                "timezone": "auto",
-            },
-        )
-    response.raise_for_status()
-    data = response.json()
-
-    if "hourly" not in data:
-        raise RuntimeError(
-            f"Open-Meteo error for ({lat}, {lng}) on {date_str}: {data}"
-        )
-
-    hourly = data["hourly"]
 
+def _weather_at(hourly: dict, target_time: datetime) -> WeatherData:
+    """Extract the forecast hour closest to *target_time* from an hourly block."""
     # Use the nearest hour index
     idx = min(target_time.hour, len(hourly["time"]) - 1)
 
     weather_code = hourly["weather_code"][idx]
+    # Codes may arrive as floats (e.g. 3.0); index the table with an int
+    code = int(weather_code)
 
     return WeatherData(
         temperature_c=hourly["temperature_2m"][idx],
@@ -95,37 +76,146 @@ async def _fetch_weather_for_point(
         precipitation_mm=hourly["precipitation"][idx],
         precipitation_probability=hourly["precipitation_probability"][idx],
         weather_code=weather_code,
-        weather_description=WMO_CODES.get(weather_code, "Unknown"),
+        weather_description=(
+            _WMO_DESCRIPTIONS[code]
+            if 0 <= code < len(_WMO_DESCRIPTIONS)
+            else "Unknown"
+        ),
         wind_speed_kmh=hourly["wind_speed_10m"][idx],
         humidity_percent=hourly["relative_humidity_2m"][idx],
     )
 
 
-client = httpx.AsyncClient(timeout=30.0)
+async def _fetch_weather_batch(
+    client: httpx.AsyncClient,
+    waypoints: list[Waypoint],
+    date_str: str,
+) -> list[WeatherData | None]:
+    """Fetch hourly forecasts for several points on one date in a single call.
+
+    Returns one entry per waypoint, in order: the closest-hour weather, or
+    ``None`` (logged here) when Open-Meteo had no data for that point or its
+    data could not be parsed. Failures of the request as a whole are raised.
+    """
+    response = await request_with_retry(
+        client,
+        "GET",
+        OPEN_METEO_URL,
+        params={
+            "latitude": ",".join(str(round(wp.location.lat, 4)) for wp in waypoints),
+            "longitude": ",".join(str(round(wp.location.lng, 4)) for wp in waypoints),
+            "hourly": ",".join(HOURLY_PARAMS),
+            "start_date": date_str,
+            "end_date": date_str,
+            "timezone": "auto",
+        },
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    # A single location comes back as an object, several as a list
+    locations = data if isinstance(data, list) else [data]
+    if len(locations) != len(waypoints):
+        raise RuntimeError(
+            f"Open-Meteo returned {len(locations)} locations for "
+            f"{len(waypoints)} points on {date_str}"
+        )
+
+    results: list[WeatherData | None] = []
+    for wp, location in zip(waypoints, locations):
+        hourly = location.get("hourly")
+        if hourly is None:
+            logger.warning(
+                "Open-Meteo returned no data for (%s, %s) on %s: %s",
+                wp.location.lat, wp.location.lng, date_str, location.get("reason"),
+            )
+            results.append(None)
+            continue
+        try:
+            results.append(_weather_at(hourly, wp.estimated_time))
+        except (TypeError, ValueError, KeyError, IndexError) as exc:
+            # A malformed location (e.g. null fields) only costs its own point
+            logger.warning(
+                "Weather parse failed for (%s, %s) on %s: %s",
+                wp.location.lat, wp.location.lng, date_str, exc,
+            )
+            results.append(None)
+    return results
+
+
+client = build_client(timeout=30.0)
+
+# Forecasts for the same 0.01° cell and hour are reused across requests for
+# a short while (alternate routes and repeat searches share many cells).
+WEATHER_CACHE_TTL = 30 * 60
+WEATHER_CACHE_MAX_ENTRIES = 10_000
+
+_weather_cache = TTLCache(ttl=WEATHER_CACHE_TTL, max_entries=WEATHER_CACHE_MAX_ENTRIES)
+
+
+def weather_cache_key(wp: Waypoint) -> tuple[int, int, int]:
+    """(lat cell, lng cell, local hour) — same bucketing as the route dedup.
+
+    The hour is counted from the waypoint's own date and ``.hour``, the
+    values ``_weather_at`` indexes the forecast with, so waypoints share a
+    key only when they would read the same forecast hour.
+    """
+    estimated_time = wp.estimated_time
+    return (
+        floor(wp.location.lat * 100),
+        floor(wp.location.lng * 100),
+        estimated_time.date().toordinal() * 24 + estimated_time.hour,
+    )
 
 
 async def get_weather_for_waypoints(
     waypoints: list[Waypoint],
 ) -> list[Waypoint]:
-    """Fetch weather for all waypoints in parallel."""
-    tasks = [
-        _fetch_weather_for_point(
-            client,
-            wp.location.lat,
-            wp.location.lng,
-            wp.estimated_time,
-        )
-        for wp in waypoints
-    ]
-    weather_results = await asyncio.gather(*tasks, return_exceptions=True)
+    """Fetch weather for all waypoints, batching points that share a date.
+
+    Waypoints in the same 0.01° cell and hour share one forecast, so each
+    such bucket is looked up once. Buckets in ``_weather_cache`` are filled
+    directly. For the rest, the bucket's first waypoint is grouped by
+    forecast date and each group is requested in chunks of up to
+    ``MAX_LOCATIONS_PER_REQUEST`` coordinates; the batches run in parallel.
+    """
+    buckets: dict[tuple[int, int, int], list[Waypoint]] = {}
+    for wp in waypoints:
+        buckets.setdefault(weather_cache_key(wp), []).append(wp)
+
+    by_date: dict[date, list[Waypoint]] = {}
+    for key, bucket in buckets.items():
+        cached = _weather_cache.get(key)
+        if cached is not None:
+            for wp in bucket:
+                wp.weather = cached
+            continue
+        by_date.setdefault(bucket[0].estimated_time.date(), []).append(bucket[0])
+
+    # Dates are formatted once per group rather than once per waypoint
+    batches: list[tuple[str, list[Waypoint]]] = []
+    for forecast_date, group in by_date.items():
+        date_str = forecast_date.isoformat()
+        for i in range(0, len(group), MAX_LOCATIONS_PER_REQUEST):
+            batches.append((date_str, group[i:i + MAX_LOCATIONS_PER_REQUEST]))
+    batch_results = await asyncio.gather(
+        *(_fetch_weather_batch(client, batch, date_str) for date_str, batch in batches),
+        return_exceptions=True,
+    )
 
-    for wp, weather in zip(waypoints, weather_results):
-        if isinstance(weather, Exception):
+    for (date_str, batch), results in zip(batches, batch_results):
+        if isinstance(results, Exception):
             logger.warning(
-                "Weather fetch failed for (%s, %s): %s",
-                wp.location.lat, wp.location.lng, weather,
+                "Weather fetch failed for %d points on %s: %s",
+                len(batch), date_str, results,
             )
-            continue  # leave wp.weather as None
-        wp.weather = weather
+            continue  # leave the batch's weather as None
+        for wp, weather in zip(batch, results):
+            if weather is None:
+                continue
+            key = weather_cache_key(wp)
+            for member in buckets[key]:
+                member.weather = weather
+            _weather_cache.set(key, weather)
 
     return waypoints
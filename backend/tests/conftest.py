@@ -8,7 +8,12 @@ os.environ.setdefault("GOOGLE_MAPS_API_KEY", "test-api-key-12345")
 os.environ.setdefault("FRONTEND_ORIGINS", "http://localhost:5173")
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
+import httpx
+import pytest_asyncio
+
+from app.main import app
 from app.models import (
     LatLng,
     RouteWithWeather,
@@ -45,6 +50,16 @@ def make_weather(
     )
 
 
+@lru_cache(maxsize=None)
+def weather_for_code(weather_code: int) -> WeatherData:
+    """Shared default ``make_weather`` instance for a WMO code.
+
+    For tests that only vary the code; WeatherData is frozen, so one
+    instance per code can be reused across tests.
+    """
+    return make_weather(weather_code=weather_code)
+
+
 def make_waypoint(
     *,
     lat: float = 37.77,
@@ -82,3 +97,24 @@ def make_route(
         total_distance_km=total_distance_km,
         waypoints=waypoints,
     )
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+# One in-process transport for the whole suite; ASGITransport is stateless
+# beyond the app reference, so any client can share it.
+_TRANSPORT = httpx.ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """ASGI test client shared by every endpoint test in the session.
+
+    Per-test state (route cache, rate limiter) is reset by the test modules
+    themselves, so the client and its transport are safe to reuse.
+    """
+    async with httpx.AsyncClient(transport=_TRANSPORT, base_url="http://test") as shared:
+        yield shared
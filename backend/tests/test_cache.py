@@ -2,7 +2,8 @@
 
 from unittest.mock import patch
 
-from app.services.cache import RouteCacheManager, TTLCache
+from app.models import MultiRouteResponse
+from app.services.cache import RedisRouteCache, RouteCacheManager, TTLCache
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +43,7 @@ class TestMakeKey:
         k1 = TTLCache.make_key("SF", "LA", None)
         k2 = TTLCache.make_key("SF", "LA", "2026-02-16T10:00:00Z")
         assert isinstance(k1, str)
-        assert len(k1) == 64  # SHA-256 hex digest
+        assert len(k1) == 32  # 128-bit BLAKE2b hex digest
         assert k1 != k2
 
 
@@ -141,3 +142,32 @@ class TestRouteCacheManager:
             manager = RouteCacheManager()
             manager.configure()
         assert manager.backend_name == "TTLCache"
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+
+class TestRedisRouteCache:
+    def _cache(self) -> RedisRouteCache:
+        cache = RedisRouteCache("redis://localhost:6379/0")
+        cache._client = _FakeRedis()
+        return cache
+
+    def test_round_trips_response_model(self):
+        cache = self._cache()
+        response = MultiRouteResponse(origin_address="SF", destination_address="LA", routes=[])
+        cache.set("k", response)
+        assert cache.get("k") == response
+
+    def test_undecodable_value_returns_none(self):
+        cache = self._cache()
+        cache._client.store["k"] = b"not json"
+        assert cache.get("k") is None
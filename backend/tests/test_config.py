@@ -50,6 +50,17 @@ class TestSettings:
             "http://localhost",
         ]
 
+    def test_allowed_origins_follows_frontend_origins(self):
+        """allowed_origins reflects later changes to frontend_origins."""
+        with patch.dict(os.environ, {
+            "GOOGLE_MAPS_API_KEY": "key",
+            "FRONTEND_ORIGINS": "http://example.com",
+        }):
+            s = Settings()
+        assert s.allowed_origins == ["http://example.com"]
+        s.frontend_origins = "http://other.example"
+        assert s.allowed_origins == ["http://other.example"]
+
     def test_missing_api_key_raises_validation_error(self):
         """If GOOGLE_MAPS_API_KEY is not set (and no .env file), Settings() should raise."""
         # Temporarily override the model_config to prevent reading .env file,
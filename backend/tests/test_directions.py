@@ -111,32 +111,62 @@ def _multi_leg_response() -> dict:
     }
 
 
+def _response_without_summary() -> dict:
+    """Default response with the "summary" key removed from the route."""
+    resp = _directions_response()
+    del resp["routes"][0]["summary"]
+    return resp
+
+
+# Mock responses are encoded once; respx clones a reused Response per request.
+_RESP_OK = httpx.Response(200, json=_directions_response())
+_RESP_ZERO_RESULTS = httpx.Response(200, json=_directions_response(status="ZERO_RESULTS"))
+_RESP_NO_ROUTES = httpx.Response(200, json=_directions_response(routes=[]))
+_RESP_MULTI = httpx.Response(200, json=_multi_leg_response())
+_RESP_NO_SUMMARY = httpx.Response(200, json=_response_without_summary())
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+def respx_router():
+    """One respx router per test class, with the Directions API route registered."""
+    with respx.mock(assert_all_called=False) as router:
+        router.get(DIRECTIONS_URL, name="directions")
+        yield router
+
+
+@pytest.fixture
+def directions_route(respx_router):
+    """The shared Directions API route with call history cleared; tests set its response."""
+    respx_router.reset()
+    return respx_router["directions"]
+
+
 class TestGetRoutes:
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_successful_response_extracts_routes(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=_directions_response())
-        )
-        result = await get_routes("San Francisco", "Los Angeles")
-
-        assert "routes" in result
-        assert len(result["routes"]) == 1
-        route = result["routes"][0]
-        assert route["summary"] == "via I-5 S"
-        assert route["overview_polyline"] == "abc123"
+    @pytest.mark.parametrize(
+        "response, summaries, polylines",
+        [
+            (_RESP_OK, ["via I-5 S"], ["abc123"]),
+            (_RESP_MULTI, ["Route A", "Route B"], ["polyA", "polyB"]),
+            (_RESP_NO_SUMMARY, [""], ["abc123"]),
+        ],
+        ids=["single_route", "multiple_routes", "missing_summary_defaults_to_empty"],
+    )
+    async def test_routes_extracted(self, directions_route, response, summaries, polylines):
+        directions_route.return_value = response
+        result = await get_routes("Origin", "Destination")
+
+        assert [r["summary"] for r in result["routes"]] == summaries
+        assert [r["overview_polyline"] for r in result["routes"]] == polylines
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_steps_flattened_from_multiple_legs(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=_multi_leg_response())
-        )
+    async def test_steps_flattened_from_multiple_legs(self, directions_route):
+        directions_route.return_value = _RESP_MULTI
         result = await get_routes("Origin", "Destination")
 
         # Route A has 2 legs with 1 step each = 2 steps total
@@ -146,11 +176,8 @@ class TestGetRoutes:
         assert route_a["steps"][1]["duration_seconds"] == 500
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_total_duration_and_distance_are_sums(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=_directions_response())
-        )
+    async def test_total_duration_and_distance_are_sums(self, directions_route):
+        directions_route.return_value = _RESP_OK
         result = await get_routes("SF", "LA")
 
         route = result["routes"][0]
@@ -160,22 +187,16 @@ class TestGetRoutes:
         assert route["total_distance_meters"] == 13000
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_origin_destination_addresses_extracted(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=_directions_response())
-        )
+    async def test_origin_destination_addresses_extracted(self, directions_route):
+        directions_route.return_value = _RESP_OK
         result = await get_routes("SF", "LA")
 
         assert result["origin_address"] == "San Francisco, CA, USA"
         assert result["destination_address"] == "Los Angeles, CA, USA"
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_non_ok_status_raises_http_exception(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=_directions_response(status="ZERO_RESULTS"))
-        )
+    async def test_non_ok_status_raises_http_exception(self, directions_route):
+        directions_route.return_value = _RESP_ZERO_RESULTS
         with pytest.raises(HTTPException) as exc_info:
             await get_routes("Nowhere", "Nowhere Else")
 
@@ -183,40 +204,10 @@ class TestGetRoutes:
         assert "ZERO_RESULTS" in str(exc_info.value.detail)
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_missing_summary_defaults_to_empty_string(self):
-        resp = _directions_response()
-        # Remove the "summary" key from the first route
-        del resp["routes"][0]["summary"]
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=resp)
-        )
-        result = await get_routes("SF", "LA")
-
-        assert result["routes"][0]["summary"] == ""
-
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_empty_routes_raises_404(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(
-                200, json=_directions_response(routes=[])
-            )
-        )
+    async def test_empty_routes_raises_404(self, directions_route):
+        directions_route.return_value = _RESP_NO_ROUTES
         with pytest.raises(HTTPException) as exc_info:
             await get_routes("SF", "LA")
 
         assert exc_info.value.status_code == 404
         assert "No routes found" in str(exc_info.value.detail)
-
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_multiple_routes_returned(self):
-        respx.get(DIRECTIONS_URL).mock(
-            return_value=httpx.Response(200, json=_multi_leg_response())
-        )
-        result = await get_routes("Origin", "Destination")
-
-        assert len(result["routes"]) == 2
-        assert result["routes"][0]["summary"] == "Route A"
-        assert result["routes"][1]["summary"] == "Route B"
@@ -2,31 +2,22 @@
 
 import uuid
 
-import httpx
 import pytest
 
-from app.main import app
+from app.main import load_static_assets
 
 
 @pytest.mark.asyncio
-async def test_request_id_header_echoes_inbound_value():
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        resp = await client.get("/health", headers={"X-Request-ID": "abc-123"})
+async def test_request_id_header_echoes_inbound_value(client):
+    resp = await client.get("/health", headers={"X-Request-ID": "abc-123"})
 
     assert resp.status_code == 200
     assert resp.headers.get("X-Request-ID") == "abc-123"
 
 
 @pytest.mark.asyncio
-async def test_request_id_header_generated_when_missing():
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        resp = await client.get("/health")
+async def test_request_id_header_generated_when_missing(client):
+    resp = await client.get("/health")
 
     assert resp.status_code == 200
     generated = resp.headers.get("X-Request-ID")
@@ -35,13 +26,26 @@ async def test_request_id_header_generated_when_missing():
 
 
 @pytest.mark.asyncio
-async def test_metrics_endpoint_exposed():
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        await client.get("/health")
-        resp = await client.get("/metrics")
+async def test_metrics_endpoint_exposed(client):
+    await client.get("/health")
+    resp = await client.get("/metrics")
 
     assert resp.status_code == 200
     assert "http_requests_total" in resp.text or "http_request_duration_seconds" in resp.text
+
+
+def test_load_static_assets_reads_files_into_memory(tmp_path):
+    assets_dir = tmp_path / "assets"
+    (assets_dir / "fonts").mkdir(parents=True)
+    (assets_dir / "index-abc123.js").write_bytes(b"console.log(1)")
+    (assets_dir / "fonts" / "inter.woff2").write_bytes(b"\x00\x01")
+
+    assets = load_static_assets(assets_dir)
+
+    assert assets["index-abc123.js"][0] == b"console.log(1)"
+    assert assets["index-abc123.js"][1] in ("text/javascript", "application/javascript")
+    assert assets["fonts/inter.woff2"][0] == b"\x00\x01"
+
+
+def test_load_static_assets_missing_dir_returns_empty(tmp_path):
+    assert load_static_assets(tmp_path / "missing") == {}
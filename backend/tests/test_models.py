@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.models import (
     LatLng,
@@ -16,6 +16,13 @@ from app.models import (
     WeatherAdvisory,
     WeatherData,
 )
+from tests.conftest import make_weather
+
+# Validators built once and reused across tests
+_WEATHER_DATA = TypeAdapter(WeatherData)
+_ADVISORY = TypeAdapter(WeatherAdvisory)
+_ROUTE_REQUEST = TypeAdapter(RouteRequest)
+_ROUTE_WITH_WEATHER = TypeAdapter(RouteWithWeather)
 
 
 # ---------------------------------------------------------------------------
@@ -35,14 +42,6 @@ class TestRouteRequest:
         req = RouteRequest(origin="SF", destination="LA", departure_time=dt)
         assert req.departure_time == dt
 
-    def test_missing_origin_raises_validation_error(self):
-        with pytest.raises(ValidationError):
-            RouteRequest(destination="LA")
-
-    def test_missing_destination_raises_validation_error(self):
-        with pytest.raises(ValidationError):
-            RouteRequest(origin="SF")
-
     def test_naive_datetime_raises_validation_error(self):
         with pytest.raises(ValidationError):
             RouteRequest(
@@ -131,24 +130,24 @@ class TestMultiRouteResponse:
 
 class TestWeatherData:
     def test_valid_weather_data(self):
-        wd = WeatherData(
-            temperature_c=15.0,
-            apparent_temperature_c=13.0,
-            precipitation_mm=0.0,
-            precipitation_probability=10,
-            weather_code=1,
-            weather_description="Mainly clear",
-            wind_speed_kmh=10.0,
-            humidity_percent=65,
+        wd = _WEATHER_DATA.validate_python(
+            {
+                "temperature_c": 15.0,
+                "apparent_temperature_c": 13.0,
+                "precipitation_mm": 0.0,
+                "precipitation_probability": 10,
+                "weather_code": 1,
+                "weather_description": "Mainly clear",
+                "wind_speed_kmh": 10.0,
+                "humidity_percent": 65,
+            }
         )
         assert wd.temperature_c == 15.0
 
-    def test_missing_field_raises_validation_error(self):
+    def test_is_frozen(self):
+        wd = make_weather()
         with pytest.raises(ValidationError):
-            WeatherData(
-                temperature_c=15.0,
-                # missing required fields
-            )
+            wd.weather_code = 95
 
 
 # ---------------------------------------------------------------------------
@@ -169,13 +168,6 @@ class TestRouteWithWeather:
         assert route.route_index == 0
         assert route.total_duration_minutes == 350
 
-    def test_missing_field_raises_validation_error(self):
-        with pytest.raises(ValidationError):
-            RouteWithWeather(
-                route_index=0,
-                # missing required fields
-            )
-
 
 # ---------------------------------------------------------------------------
 # WeatherAdvisory
@@ -184,29 +176,47 @@ class TestRouteWithWeather:
 
 class TestWeatherAdvisory:
     def test_valid_advisory(self):
-        adv = WeatherAdvisory(
-            type="heavy_rain",
-            severity="danger",
-            message="Heavy rain expected near SF",
+        adv = _ADVISORY.validate_python(
+            {"type": "heavy_rain", "severity": "danger", "message": "Heavy rain expected near SF"}
         )
         assert adv.severity == "danger"
 
     def test_warning_severity(self):
-        adv = WeatherAdvisory(
-            type="fog",
-            severity="warning",
-            message="Fog near SF",
+        adv = _ADVISORY.validate_python(
+            {"type": "fog", "severity": "warning", "message": "Fog near SF"}
         )
         assert adv.severity == "warning"
 
     def test_invalid_severity_raises_validation_error(self):
         with pytest.raises(ValidationError):
-            WeatherAdvisory(
-                type="rain",
-                severity="info",
-                message="Some rain",
+            _ADVISORY.validate_python(
+                {"type": "rain", "severity": "info", "message": "Some rain"}
             )
 
-    def test_missing_field_raises_validation_error(self):
+
+# ---------------------------------------------------------------------------
+# Missing required fields
+# ---------------------------------------------------------------------------
+
+
+class TestMissingFields:
+    @pytest.mark.parametrize(
+        "adapter, data",
+        [
+            (_ROUTE_REQUEST, {"destination": "LA"}),
+            (_ROUTE_REQUEST, {"origin": "SF"}),
+            (_WEATHER_DATA, {"temperature_c": 15.0}),
+            (_ROUTE_WITH_WEATHER, {"route_index": 0}),
+            (_ADVISORY, {"type": "rain"}),
+        ],
+        ids=[
+            "route_request_origin",
+            "route_request_destination",
+            "weather_data",
+            "route_with_weather",
+            "weather_advisory",
+        ],
+    )
+    def test_missing_field_raises_validation_error(self, adapter, data):
         with pytest.raises(ValidationError):
-            WeatherAdvisory(type="rain")
+            adapter.validate_python(data)
@@ -1,9 +1,10 @@
 """Integration tests for app.routes — the POST /api/route-weather endpoint."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
+import orjson
 import pytest
 from fastapi import HTTPException
 
@@ -15,7 +16,10 @@ from app.models import (
     Waypoint,
 )
 from app.rate_limit import SLOWAPI_AVAILABLE, limiter
-from app.services.cache import route_cache
+from app.routes import RouteServices, route_services
+from app.services.cache import TTLCache, route_cache
+from app.services.scoring import weather_columns
+from tests.conftest import make_weather
 
 
 # ---------------------------------------------------------------------------
@@ -23,7 +27,7 @@ from app.services.cache import route_cache
 # ---------------------------------------------------------------------------
 
 
-def _sample_route_data() -> dict:
+def _build_route_data() -> dict:
     """Minimal return value for get_routes."""
     return {
         "origin_address": "San Francisco, CA, USA",
@@ -48,17 +52,20 @@ def _sample_route_data() -> dict:
     }
 
 
-def _sample_waypoints() -> list[Waypoint]:
-    """Minimal list of waypoints returned by sample_route_points."""
+def _build_waypoints() -> list[Waypoint]:
+    """Minimal list of waypoints returned by sample_route_points.
+
+    Trusted literals, so validation is skipped with ``model_construct``.
+    """
     return [
-        Waypoint(
-            location=LatLng(lat=37.77, lng=-122.42),
+        Waypoint.model_construct(
+            location=LatLng.model_construct(lat=37.77, lng=-122.42),
             minutes_from_start=0,
             estimated_time=datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc),
             weather=None,
         ),
-        Waypoint(
-            location=LatLng(lat=34.05, lng=-118.24),
+        Waypoint.model_construct(
+            location=LatLng.model_construct(lat=34.05, lng=-118.24),
             minutes_from_start=350,
             estimated_time=datetime(2026, 2, 16, 15, 50, tzinfo=timezone.utc),
             weather=None,
@@ -66,11 +73,11 @@ def _sample_waypoints() -> list[Waypoint]:
     ]
 
 
-def _sample_recommendation() -> RouteRecommendation:
-    return RouteRecommendation(
+def _build_recommendation() -> RouteRecommendation:
+    return RouteRecommendation.model_construct(
         recommended_route_index=0,
         scores=[
-            RouteScore(
+            RouteScore.model_construct(
                 overall_score=85.0,
                 duration_score=90.0,
                 weather_score=80.0,
@@ -81,206 +88,271 @@ def _sample_recommendation() -> RouteRecommendation:
     )
 
 
+def _json(resp: httpx.Response):
+    """Decode a response body with orjson, as the app itself encodes it."""
+    return orjson.loads(resp.content)
+
+
+# Sample payloads are built once; the accessors below hand out copies only
+# of the parts the endpoint (or a test) mutates.
+_ROUTE_DATA = _build_route_data()
+_WAYPOINTS = _build_waypoints()
+_RECOMMENDATION = _build_recommendation()
+
+
+def _sample_route_data() -> dict:
+    """Route data with its own ``routes`` list, so tests can append routes."""
+    return {**_ROUTE_DATA, "routes": list(_ROUTE_DATA["routes"])}
+
+
+def _sample_waypoints() -> list[Waypoint]:
+    """Shallow copies: the endpoint assigns ``weather`` onto each waypoint."""
+    return [wp.model_copy() for wp in _WAYPOINTS]
+
+
+def _sample_recommendation() -> RouteRecommendation:
+    return _RECOMMENDATION
+
+
+# Pipeline stages in app.routes, mocked once and reset per test by ``patched``
+_MOCKS = {
+    "routes": AsyncMock(),
+    "sample": MagicMock(),
+    "weather": AsyncMock(),
+    "score": AsyncMock(),
+}
+_MOCK_SERVICES = RouteServices(
+    get_routes=_MOCKS["routes"],
+    sample_route_points=_MOCKS["sample"],
+    get_weather_for_waypoints=_MOCKS["weather"],
+    score_routes=_MOCKS["score"],
+)
+
+
+@pytest.fixture
+def patched():
+    """Inject mocked pipeline stages via ``app.dependency_overrides``.
+
+    The shared mocks are reset and given the sample return values, so tests
+    only override what they need.
+    """
+    defaults = {
+        "routes": _sample_route_data(),
+        "sample": _sample_waypoints(),
+        "weather": [],
+        "score": _sample_recommendation(),
+    }
+    for name, mock in _MOCKS.items():
+        mock.reset_mock(return_value=True, side_effect=True)
+        mock.return_value = defaults[name]
+    app.dependency_overrides[route_services] = lambda: _MOCK_SERVICES
+    yield _MOCKS
+    app.dependency_overrides.pop(route_services, None)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 
+def _reset_limiter() -> None:
+    storage = getattr(limiter, "_storage", None)
+    if storage and hasattr(storage, "reset"):
+        storage.reset()
+
+
 class TestRouteWeatherEndpoint:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
-        """Clear the route cache before each test."""
-        route_cache.clear()
-        storage = getattr(limiter, "_storage", None)
-        if storage and hasattr(storage, "reset"):
-            storage.reset()
+        """Give each test an empty route cache and a fresh rate-limit window.
+
+        The cache backend is swapped for a new one and restored afterwards,
+        which costs the same however many entries a test stored.
+        """
+        original = route_cache._backend
+        route_cache._backend = TTLCache()
+        _reset_limiter()
         yield
-        route_cache.clear()
-        storage = getattr(limiter, "_storage", None)
-        if storage and hasattr(storage, "reset"):
-            storage.reset()
+        route_cache._backend = original
+        _reset_limiter()
 
     @pytest.mark.asyncio
-    async def test_successful_end_to_end(self):
-        with (
-            patch("app.routes.get_routes", new_callable=AsyncMock) as mock_routes,
-            patch("app.routes.sample_route_points") as mock_sample,
-            patch("app.routes.get_weather_for_waypoints", new_callable=AsyncMock) as mock_weather,
-            patch("app.routes.score_routes", new_callable=AsyncMock) as mock_score,
-        ):
-            mock_routes.return_value = _sample_route_data()
-            mock_sample.return_value = _sample_waypoints()
-            mock_weather.return_value = []
-            mock_score.return_value = _sample_recommendation()
-
-            async with httpx.AsyncClient(
-                transport=httpx.ASGITransport(app=app),
-                base_url="http://test",
-            ) as client:
-                resp = await client.post(
-                    "/api/route-weather",
-                    json={
-                        "origin": "San Francisco, CA",
-                        "destination": "Los Angeles, CA",
-                    },
-                )
-
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["origin_address"] == "San Francisco, CA, USA"
-            assert data["destination_address"] == "Los Angeles, CA, USA"
+    async def test_successful_end_to_end(self, client, patched):
+        resp = await client.post(
+            "/api/route-weather",
+            json={
+                "origin": "San Francisco, CA",
+                "destination": "Los Angeles, CA",
+            },
+        )
+
+        assert resp.status_code == 200
+        data = _json(resp)
+        assert data["origin_address"] == "San Francisco, CA, USA"
+        assert data["destination_address"] == "Los Angeles, CA, USA"
 
     @pytest.mark.asyncio
-    async def test_response_includes_correct_fields(self):
-        with (
-            patch("app.routes.get_routes", new_callable=AsyncMock) as mock_routes,
-            patch("app.routes.sample_route_points") as mock_sample,
-            patch("app.routes.get_weather_for_waypoints", new_callable=AsyncMock) as mock_weather,
-            patch("app.routes.score_routes", new_callable=AsyncMock) as mock_score,
-        ):
-            mock_routes.return_value = _sample_route_data()
-            mock_sample.return_value = _sample_waypoints()
-            mock_weather.return_value = []
-            mock_score.return_value = _sample_recommendation()
-
-            async with httpx.AsyncClient(
-                transport=httpx.ASGITransport(app=app),
-                base_url="http://test",
-            ) as client:
-                resp = await client.post(
-                    "/api/route-weather",
-                    json={
-                        "origin": "SF",
-                        "destination": "LA",
-                    },
-                )
-
-            data = resp.json()
-            assert "origin_address" in data
-            assert "destination_address" in data
-            assert "routes" in data
-            assert "recommendation" in data
-            assert len(data["routes"]) == 1
-            route = data["routes"][0]
-            assert "overview_polyline" in route
-            assert "summary" in route
-            assert "total_duration_minutes" in route
-            assert "total_distance_km" in route
-            assert "waypoints" in route
+    async def test_response_includes_correct_fields(self, client, patched):
+        resp = await client.post(
+            "/api/route-weather",
+            json={
+                "origin": "SF",
+                "destination": "LA",
+            },
+        )
+
+        data = _json(resp)
+        assert "origin_address" in data
+        assert "destination_address" in data
+        assert "routes" in data
+        assert "recommendation" in data
+        assert len(data["routes"]) == 1
+        route = data["routes"][0]
+        assert "overview_polyline" in route
+        assert "summary" in route
+        assert "total_duration_minutes" in route
+        assert "total_distance_km" in route
+        assert "waypoints" in route
 
     @pytest.mark.asyncio
-    async def test_cache_hit_returns_cached_response(self):
+    async def test_cache_hit_returns_cached_response(self, client, patched):
         """A second identical request should return the cached response."""
-        with (
-            patch("app.routes.get_routes", new_callable=AsyncMock) as mock_routes,
-            patch("app.routes.sample_route_points") as mock_sample,
-            patch("app.routes.get_weather_for_waypoints", new_callable=AsyncMock) as mock_weather,
-            patch("app.routes.score_routes", new_callable=AsyncMock) as mock_score,
-        ):
-            mock_routes.return_value = _sample_route_data()
-            mock_sample.return_value = _sample_waypoints()
-            mock_weather.return_value = []
-            mock_score.return_value = _sample_recommendation()
-
-            request_body = {
-                "origin": "San Francisco, CA",
-                "destination": "Los Angeles, CA",
-            }
+        request_body = {
+            "origin": "San Francisco, CA",
+            "destination": "Los Angeles, CA",
+        }
 
-            async with httpx.AsyncClient(
-                transport=httpx.ASGITransport(app=app),
-                base_url="http://test",
-            ) as client:
-                resp1 = await client.post("/api/route-weather", json=request_body)
-                resp2 = await client.post("/api/route-weather", json=request_body)
+        resp1 = await client.post("/api/route-weather", json=request_body)
+        resp2 = await client.post("/api/route-weather", json=request_body)
 
-            assert resp1.status_code == 200
-            assert resp2.status_code == 200
-            # get_routes should only be called once (second time is cached)
-            assert mock_routes.call_count == 1
+        assert resp1.status_code == 200
+        assert resp2.status_code == 200
+        # get_routes should only be called once (second time is cached)
+        assert patched["routes"].call_count == 1
 
     @pytest.mark.asyncio
-    async def test_http_exception_propagates(self):
-        with patch("app.routes.get_routes", new_callable=AsyncMock) as mock_routes:
-            mock_routes.side_effect = HTTPException(
-                status_code=400,
-                detail="Directions API error: ZERO_RESULTS",
+    async def test_overlapping_waypoints_fetch_weather_once(self, client, patched):
+        """Waypoints in the same grid cell and hour share one weather fetch."""
+        route_data = _sample_route_data()
+        route_data["routes"].append(dict(route_data["routes"][0], summary="via US-101 S"))
+        patched["routes"].return_value = route_data
+        patched["sample"].side_effect = lambda *_: _sample_waypoints()
+
+        resp = await client.post(
+            "/api/route-weather",
+            json={"origin": "SF", "destination": "LA"},
+        )
+
+        assert resp.status_code == 200
+        unique_waypoints = patched["weather"].call_args.args[0]
+        assert len(unique_waypoints) == 2
+
+    @pytest.mark.asyncio
+    async def test_waypoints_in_different_local_hours_not_merged(self, client, patched):
+        """Dedup follows the forecast lookup's local hour, not the epoch hour."""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        patched["sample"].return_value = [
+            Waypoint.model_construct(
+                location=LatLng.model_construct(lat=28.61, lng=77.21),
+                minutes_from_start=minutes,
+                estimated_time=datetime(2026, 2, 16, 10, 50, tzinfo=ist)
+                + timedelta(minutes=minutes),
+                weather=None,
             )
+            for minutes in (0, 20)
+        ]
 
-            async with httpx.AsyncClient(
-                transport=httpx.ASGITransport(app=app),
-                base_url="http://test",
-            ) as client:
-                resp = await client.post(
-                    "/api/route-weather",
-                    json={"origin": "Nowhere", "destination": "Nowhere"},
-                )
+        resp = await client.post(
+            "/api/route-weather",
+            json={"origin": "SF", "destination": "LA"},
+        )
 
-            assert resp.status_code == 400
-            assert "ZERO_RESULTS" in resp.json()["detail"]
+        assert resp.status_code == 200
+        unique_waypoints = patched["weather"].call_args.args[0]
+        assert len(unique_waypoints) == 2
 
     @pytest.mark.asyncio
-    async def test_generic_exception_returns_500(self):
-        with patch("app.routes.get_routes", new_callable=AsyncMock) as mock_routes:
-            mock_routes.side_effect = RuntimeError("Unexpected failure")
-
-            async with httpx.AsyncClient(
-                transport=httpx.ASGITransport(app=app),
-                base_url="http://test",
-            ) as client:
-                resp = await client.post(
-                    "/api/route-weather",
-                    json={"origin": "SF", "destination": "LA"},
-                )
-
-            assert resp.status_code == 500
-            assert resp.json()["detail"] == "Internal server error"
+    async def test_weather_columns_attached_to_scored_routes(self, client, patched):
+        """Each route reaches scoring with weather arrays matching its waypoints."""
+        route_data = _sample_route_data()
+        route_data["routes"].append(dict(route_data["routes"][0], summary="via US-101 S"))
+
+        async def fake_weather(waypoints):
+            for i, wp in enumerate(waypoints):
+                if i:  # leave the first unique waypoint without weather
+                    wp.weather = make_weather(weather_code=60 + i, wind_speed_kmh=10.0 * i)
+            return waypoints
+
+        patched["routes"].return_value = route_data
+        patched["sample"].side_effect = lambda *_: _sample_waypoints()
+        patched["weather"].side_effect = fake_weather
+
+        resp = await client.post(
+            "/api/route-weather",
+            json={"origin": "SF", "destination": "LA"},
+        )
+
+        assert resp.status_code == 200
+        scored_routes = patched["score"].call_args.args[0]
+        assert len(scored_routes) == 2
+        for route in scored_routes:
+            expected = weather_columns([wp.weather for wp in route.waypoints])
+            for attached, built in zip(route._weather_columns, expected):
+                assert attached.tolist() == built.tolist()
 
     @pytest.mark.asyncio
-    async def test_naive_departure_time_returns_422(self):
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            resp = await client.post(
-                "/api/route-weather",
-                json={
-                    "origin": "SF",
-                    "destination": "LA",
-                    "departure_time": "2026-02-16T10:00",
-                },
-            )
+    async def test_http_exception_propagates(self, client, patched):
+        patched["routes"].side_effect = HTTPException(
+            status_code=400,
+            detail="Directions API error: ZERO_RESULTS",
+        )
+
+        resp = await client.post(
+            "/api/route-weather",
+            json={"origin": "Nowhere", "destination": "Nowhere"},
+        )
+
+        assert resp.status_code == 400
+        assert "ZERO_RESULTS" in _json(resp)["detail"]
+
+    @pytest.mark.asyncio
+    async def test_generic_exception_returns_500(self, client, patched):
+        patched["routes"].side_effect = RuntimeError("Unexpected failure")
+
+        resp = await client.post(
+            "/api/route-weather",
+            json={"origin": "SF", "destination": "LA"},
+        )
+
+        assert resp.status_code == 500
+        assert _json(resp)["detail"] == "Internal server error"
+
+    @pytest.mark.asyncio
+    async def test_naive_departure_time_returns_422(self, client):
+        resp = await client.post(
+            "/api/route-weather",
+            json={
+                "origin": "SF",
+                "destination": "LA",
+                "departure_time": "2026-02-16T10:00",
+            },
+        )
 
         assert resp.status_code == 422
 
     @pytest.mark.asyncio
     @pytest.mark.skipif(not SLOWAPI_AVAILABLE, reason="slowapi not installed")
-    async def test_rate_limit_exceeded_returns_429(self):
-        with (
-            patch("app.routes.get_routes", new_callable=AsyncMock) as mock_routes,
-            patch("app.routes.sample_route_points") as mock_sample,
-            patch("app.routes.get_weather_for_waypoints", new_callable=AsyncMock) as mock_weather,
-            patch("app.routes.score_routes", new_callable=AsyncMock) as mock_score,
-        ):
-            mock_routes.return_value = _sample_route_data()
-            mock_sample.return_value = _sample_waypoints()
-            mock_weather.return_value = []
-            mock_score.return_value = _sample_recommendation()
-
-            statuses: list[int] = []
-            details: list[str] = []
-            async with httpx.AsyncClient(
-                transport=httpx.ASGITransport(app=app),
-                base_url="http://test",
-            ) as client:
-                for _ in range(40):
-                    resp = await client.post(
-                        "/api/route-weather",
-                        json={"origin": "SF", "destination": "LA"},
-                    )
-                    statuses.append(resp.status_code)
-                    if resp.status_code == 429:
-                        details.append(resp.json().get("detail", ""))
-
-            assert 429 in statuses
-            assert "Rate limit exceeded" in details
+    async def test_rate_limit_exceeded_returns_429(self, client, patched):
+        statuses: list[int] = []
+        details: list[str] = []
+        for _ in range(40):
+            resp = await client.post(
+                "/api/route-weather",
+                json={"origin": "SF", "destination": "LA"},
+            )
+            statuses.append(resp.status_code)
+            if resp.status_code == 429:
+                details.append(_json(resp).get("detail", ""))
+
+        assert 429 in statuses
+        assert "Rate limit exceeded" in details
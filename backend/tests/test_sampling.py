@@ -1,10 +1,21 @@
 """Tests for app.services.sampling — Haversine, interpolation, route sampling."""
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from unittest.mock import patch
 
+import numpy as np
 import polyline as polyline_codec
+import pytest
 
-from app.services.sampling import _haversine, _interpolate, sample_route_points
+from app.models import LatLng, Waypoint
+from app.services.sampling import (
+    _decode_polylines,
+    _haversine,
+    _interpolate,
+    _segment_distances,
+    sample_route_points,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -12,6 +23,23 @@ from app.services.sampling import _haversine, _interpolate, sample_route_points
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _encode(points: tuple[tuple[float, float], ...]) -> str:
+    """Polyline encoding, memoized: tests reuse the same few point lists."""
+    return polyline_codec.encode(list(points))
+
+
+@lru_cache(maxsize=None)
+def _total_haversine(points: tuple[tuple[float, float], ...]) -> float:
+    """Sum of haversine distances between consecutive points, memoized.
+
+    Uses the sampler's vectorized ``_segment_distances`` over all segments
+    at once rather than a per-pair ``_haversine`` loop.
+    """
+    coords = np.asarray(points, dtype=np.float64)
+    return float(_segment_distances(coords[:, 0], coords[:, 1]).sum())
+
+
 def _make_step(
     points: list[tuple[float, float]],
     duration_seconds: int,
@@ -23,12 +51,10 @@ def _make_step(
     distances between consecutive points so that the internal speed
     calculation is consistent.
     """
+    points = tuple(points)
     if distance_meters is None:
-        distance_meters = sum(
-            _haversine(points[i], points[i + 1])
-            for i in range(len(points) - 1)
-        )
-    encoded = polyline_codec.encode(points)
+        distance_meters = _total_haversine(points)
+    encoded = _encode(points)
     return {
         "duration_seconds": duration_seconds,
         "distance_meters": distance_meters,
@@ -57,18 +83,61 @@ P3 = (37.8019, -122.3894)  # ~1.3 km from P2
 
 
 class TestHaversine:
-    def test_same_point_is_zero(self):
-        assert _haversine(SF, SF) == 0.0
-
-    def test_sf_to_la_approx_559km(self):
-        dist = _haversine(SF, LA)
-        # Expected ~559 km
-        assert 555_000 < dist < 565_000
+    @pytest.mark.parametrize(
+        "p1, p2, low, high",
+        [
+            (SF, SF, 0.0, 0.0),
+            (SF, LA, 555_000, 565_000),  # ~559 km
+            (P0, P1, 1_000, 1_500),  # ~1.3 km
+        ],
+        ids=["same_point_is_zero", "sf_to_la_approx_559km", "nearby_points_approx_1km"],
+    )
+    def test_known_distances(self, p1, p2, low, high):
+        assert low <= _haversine(p1, p2) <= high
 
     def test_symmetry(self):
         assert abs(_haversine(SF, LA) - _haversine(LA, SF)) < 0.01
 
 
+# ---------------------------------------------------------------------------
+# _segment_distances
+# ---------------------------------------------------------------------------
+
+
+class TestSegmentDistances:
+    def test_matches_pairwise_haversine(self):
+        points = np.array([P0, P1, P2, P3])
+        dists = _segment_distances(points[:, 0], points[:, 1])
+        expected = [_haversine(points[i], points[i + 1]) for i in range(3)]
+        assert dists.tolist() == pytest.approx(expected)
+
+    def test_single_point_has_no_segments(self):
+        assert _segment_distances(np.array([SF[0]]), np.array([SF[1]])).size == 0
+
+
+# ---------------------------------------------------------------------------
+# _decode_polylines
+# ---------------------------------------------------------------------------
+
+
+class TestDecodePolylines:
+    def test_matches_reference_decoder(self):
+        encoded = [
+            polyline_codec.encode([SF, LA]),
+            polyline_codec.encode([P0, P1, P2, P3]),
+            polyline_codec.encode([(-33.8688, 151.2093)]),
+        ]
+        decoded = _decode_polylines(encoded)
+
+        assert len(decoded) == 3
+        for enc, arr in zip(encoded, decoded):
+            assert arr.tolist() == [list(p) for p in polyline_codec.decode(enc)]
+
+    def test_empty_strings_yield_empty_arrays(self):
+        decoded = _decode_polylines(["", polyline_codec.encode([P0, P1]), ""])
+        assert [arr.shape for arr in decoded] == [(0, 2), (2, 2), (0, 2)]
+
+
 # ---------------------------------------------------------------------------
 # _interpolate
 # ---------------------------------------------------------------------------
@@ -184,3 +253,21 @@ class TestSampleRoutePoints:
         wp_15 = [wp for wp in result if wp.minutes_from_start == 15]
         assert len(wp_15) == 1
         assert wp_15[0].estimated_time == DEPARTURE + timedelta(seconds=900)
+
+    def test_waypoints_built_without_revalidation(self):
+        """Waypoints come from model_construct, never the validating __init__."""
+        step = _make_step([P0, P1, P2], duration_seconds=1800)
+        with (
+            patch.object(Waypoint, "__init__", side_effect=AssertionError),
+            patch.object(LatLng, "__init__", side_effect=AssertionError),
+        ):
+            result = sample_route_points([step], DEPARTURE)
+
+        for wp in result:
+            assert wp.__pydantic_fields_set__ == {
+                "location",
+                "minutes_from_start",
+                "estimated_time",
+            }
+            assert wp.location.__pydantic_fields_set__ == {"lat", "lng"}
+            assert wp.weather is None
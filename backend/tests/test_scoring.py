@@ -1,15 +1,25 @@
 """Tests for app.services.scoring — feature extraction, advisories, scoring."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import httpx
+import numpy as np
 import pytest
+import respx
+from app.services import scoring
 from app.services.scoring import (
-    _check_advisory_conditions,
+    _advisory_matrix,
+    _build_advisories,
     _generate_reason,
+    _load_model,
+    _pending_advisories,
+    _reverse_geocode_batch,
     extract_features,
     score_routes,
+    weather_columns,
 )
-from tests.conftest import make_route, make_waypoint, make_weather
+from tests.conftest import make_route, make_waypoint, make_weather, weather_for_code
 
 
 # ---------------------------------------------------------------------------
@@ -42,8 +52,8 @@ class TestExtractFeatures:
 
     def test_adverse_waypoints_fraction(self):
         """weather_code >= 61 counts as adverse."""
-        w_clear = make_weather(weather_code=1)
-        w_rain = make_weather(weather_code=65)
+        w_clear = weather_for_code(1)
+        w_rain = weather_for_code(65)
         wps = [
             make_waypoint(weather=w_clear),
             make_waypoint(weather=w_rain),
@@ -69,6 +79,27 @@ class TestExtractFeatures:
         # avg_precip_prob = 60
         assert features[8] == pytest.approx(60.0)
 
+    def test_severity_matches_lookup_and_defaults_unknown_codes(self):
+        """Known codes use WMO_SEVERITY; codes outside the table use 0.5."""
+        wps = [
+            make_waypoint(weather=weather_for_code(code))
+            for code in (0, 65, 42, 150)
+        ]
+        route = make_route(total_duration_minutes=100, waypoints=wps)
+        features = extract_features(route, min_duration=100)
+        expected = [0.0, 0.70, 0.5, 0.5]
+        assert features[1] == pytest.approx(sum(expected) / len(expected))
+        assert features[2] == pytest.approx(0.70)
+
+    def test_writes_into_out_row(self):
+        """Features are written in place into a provided row of a matrix."""
+        route = make_route(total_duration_minutes=200)
+        matrix = np.full((2, 9), -1.0, dtype=np.float32)
+        result = extract_features(route, min_duration=100, out=matrix[1])
+        assert np.shares_memory(result, matrix)
+        assert matrix[1, 0] == pytest.approx(2.0)
+        assert (matrix[0] == -1.0).all()
+
     def test_min_duration_zero_handled(self):
         """min_duration=0 should not cause ZeroDivisionError (uses max(0,1))."""
         route = make_route(total_duration_minutes=100)
@@ -77,107 +108,227 @@ class TestExtractFeatures:
 
 
 # ---------------------------------------------------------------------------
-# _check_advisory_conditions
+# weather_columns
 # ---------------------------------------------------------------------------
 
 
-class TestCheckAdvisoryConditions:
-    def test_no_weather_returns_empty(self):
-        wp = make_waypoint(weather=None)
-        assert _check_advisory_conditions(wp) == []
-
-    def test_clear_weather_returns_empty(self):
-        wp = make_waypoint(weather=make_weather(weather_code=1, precipitation_mm=0, wind_speed_kmh=10))
-        assert _check_advisory_conditions(wp) == []
-
-    def test_heavy_rain_code_65(self):
-        wp = make_waypoint(weather=make_weather(weather_code=65))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("heavy_rain", "danger") in types
-
-    def test_heavy_rain_code_82(self):
-        wp = make_waypoint(weather=make_weather(weather_code=82))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("heavy_rain", "danger") in types
-
-    def test_heavy_rain_by_precipitation(self):
-        wp = make_waypoint(weather=make_weather(weather_code=0, precipitation_mm=8.0))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("heavy_rain", "danger") in types
-
-    def test_moderate_rain_code_63(self):
-        wp = make_waypoint(weather=make_weather(weather_code=63))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("moderate_rain", "warning") in types
-
-    def test_moderate_rain_code_81(self):
-        wp = make_waypoint(weather=make_weather(weather_code=81))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("moderate_rain", "warning") in types
-
-    def test_moderate_rain_by_precipitation(self):
-        wp = make_waypoint(weather=make_weather(weather_code=0, precipitation_mm=5.0))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("moderate_rain", "warning") in types
-
-    def test_freezing_rain(self):
-        for code in (56, 57, 66, 67):
-            wp = make_waypoint(weather=make_weather(weather_code=code))
-            results = _check_advisory_conditions(wp)
-            types = [(t, s) for t, s, _ in results]
-            assert ("freezing_rain", "danger") in types, f"Failed for code {code}"
-
-    def test_heavy_snow(self):
-        for code in (73, 75, 86):
-            wp = make_waypoint(weather=make_weather(weather_code=code))
-            results = _check_advisory_conditions(wp)
-            types = [(t, s) for t, s, _ in results]
-            assert ("heavy_snow", "danger") in types, f"Failed for code {code}"
-
-    def test_snow_warning(self):
-        for code in (71, 77, 85):
-            wp = make_waypoint(weather=make_weather(weather_code=code))
-            results = _check_advisory_conditions(wp)
-            types = [(t, s) for t, s, _ in results]
-            assert ("snow", "warning") in types, f"Failed for code {code}"
-
-    def test_high_wind_danger(self):
-        wp = make_waypoint(weather=make_weather(wind_speed_kmh=80.0))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("high_wind", "danger") in types
-
-    def test_high_wind_warning(self):
-        wp = make_waypoint(weather=make_weather(wind_speed_kmh=60.0))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("high_wind", "warning") in types
-
-    def test_thunderstorm(self):
-        wp = make_waypoint(weather=make_weather(weather_code=95))
-        results = _check_advisory_conditions(wp)
-        types = [(t, s) for t, s, _ in results]
-        assert ("thunderstorm", "danger") in types
-
-    def test_hail(self):
-        for code in (96, 99):
-            wp = make_waypoint(weather=make_weather(weather_code=code))
-            results = _check_advisory_conditions(wp)
-            types = [(t, s) for t, s, _ in results]
-            assert ("hail", "danger") in types, f"Failed for code {code}"
-
-    def test_fog(self):
-        for code in (45, 48):
-            wp = make_waypoint(weather=make_weather(weather_code=code))
-            results = _check_advisory_conditions(wp)
-            types = [(t, s) for t, s, _ in results]
-            assert ("fog", "warning") in types, f"Failed for code {code}"
+class TestWeatherColumns:
+    def test_missing_weather_marked_absent(self):
+        columns = weather_columns([
+            make_weather(weather_code=63, wind_speed_kmh=30.0, precipitation_mm=4.5),
+            None,
+        ])
+        assert columns.present.tolist() == [True, False]
+        assert columns.codes.tolist() == [63, 0]
+        assert columns.wind.tolist() == [30.0, 0.0]
+        assert columns.precip.tolist() == [4.5, 0.0]
+
+    def test_take_reorders_rows(self):
+        columns = weather_columns([weather_for_code(1), weather_for_code(2)])
+        assert columns.take(np.array([1, 1, 0])).codes.tolist() == [2, 2, 1]
+
+    def test_attached_columns_used_for_features(self):
+        route = make_route(total_duration_minutes=100, waypoints=[make_waypoint(weather=None)])
+        route._weather_columns = weather_columns([make_weather(wind_speed_kmh=42.0)])
+        features = extract_features(route, min_duration=100)
+        assert features[3] == pytest.approx(42.0)
+
+
+# ---------------------------------------------------------------------------
+# _load_model
+# ---------------------------------------------------------------------------
+
+
+class TestLoadModel:
+    def test_falls_back_to_joblib_without_onnxruntime(self, monkeypatch):
+        monkeypatch.setattr(scoring, "onnxruntime", None)
+        model = _load_model()
+        assert not isinstance(model, scoring._OnnxModel)
+        assert model.predict(np.zeros((2, 9))).shape == (2,)
+
+    def test_predictions_match_between_backends(self):
+        if scoring.onnxruntime is None or not scoring._ONNX_MODEL_PATH.is_file():
+            pytest.skip("ONNX model or onnxruntime unavailable")
+        X = np.array([[1.0, 0.1, 0.2, 10.0, 20.0, 0.5, 1.0, 0.1, 30.0]])
+        onnx_pred = scoring._OnnxModel(scoring._ONNX_MODEL_PATH).predict(X)
+        sklearn_pred = scoring.joblib.load(scoring._MODEL_PATH).predict(X)
+        assert onnx_pred[0] == pytest.approx(sklearn_pred[0], abs=1e-3)
+
+
+# ---------------------------------------------------------------------------
+# _reverse_geocode_batch
+# ---------------------------------------------------------------------------
+
+
+def _geocode_response(town: str, state: str) -> dict:
+    return {
+        "status": "OK",
+        "results": [{
+            "address_components": [
+                {"long_name": town, "types": ["locality"]},
+                {"long_name": state, "short_name": state, "types": ["administrative_area_level_1"]},
+            ],
+        }],
+    }
+
+
+class TestReverseGeocodeBatch:
+    @pytest.fixture(autouse=True)
+    def clear_geocode_cache(self):
+        scoring._geocode_cache.clear()
+        yield
+        scoring._geocode_cache.clear()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_repeated_cells_served_from_cache(self):
+        route = respx.get(scoring.GEOCODE_URL).mock(
+            return_value=httpx.Response(200, json=_geocode_response("Fresno", "CA"))
+        )
+        first = await _reverse_geocode_batch([(36.7378, -119.7871)])
+        second = await _reverse_geocode_batch([(36.7321, -119.7899)])
+
+        assert first == {(36.7378, -119.7871): "Fresno, CA"}
+        assert second == {(36.7321, -119.7899): "Fresno, CA"}
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_lookups_are_not_cached(self):
+        route = respx.get(scoring.GEOCODE_URL).mock(
+            return_value=httpx.Response(200, json={"status": "OVER_QUERY_LIMIT"})
+        )
+        result = await _reverse_geocode_batch([(36.7378, -119.7871)])
+        await _reverse_geocode_batch([(36.7378, -119.7871)])
+
+        assert result == {(36.7378, -119.7871): "36.7\u00b0N, 119.8\u00b0W"}
+        assert route.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# _advisory_matrix
+# ---------------------------------------------------------------------------
+
+
+def _triggered(weather) -> list[tuple[str, str]]:
+    """(type, severity) of every advisory a single waypoint triggers."""
+    return [(p.type, p.severity) for p in _pending_advisories([make_waypoint(weather=weather)])]
+
+
+class TestAdvisoryMatrix:
+    def test_clear_weather_triggers_nothing(self):
+        matrix = _advisory_matrix(np.array([1]), np.array([10.0]), np.array([0.0]))
+        assert matrix.shape == (1, 10)
+        assert not matrix.any()
+
+    def test_rows_evaluated_independently(self):
+        matrix = _advisory_matrix(
+            np.array([95, 0, 1]), np.array([0.0, 80.0, 10.0]), np.array([0.0, 0.0, 8.0])
+        )
+        assert matrix.sum(axis=1).tolist() == [1, 1, 1]
+        assert matrix.any(axis=0).sum() == 3
+
+    @pytest.mark.parametrize(
+        "code, expected",
+        [
+            (65, ("heavy_rain", "danger")),
+            (82, ("heavy_rain", "danger")),
+            (63, ("moderate_rain", "warning")),
+            (81, ("moderate_rain", "warning")),
+            (56, ("freezing_rain", "danger")),
+            (57, ("freezing_rain", "danger")),
+            (66, ("freezing_rain", "danger")),
+            (67, ("freezing_rain", "danger")),
+            (73, ("heavy_snow", "danger")),
+            (75, ("heavy_snow", "danger")),
+            (86, ("heavy_snow", "danger")),
+            (71, ("snow", "warning")),
+            (77, ("snow", "warning")),
+            (85, ("snow", "warning")),
+            (95, ("thunderstorm", "danger")),
+            (96, ("hail", "danger")),
+            (99, ("hail", "danger")),
+            (45, ("fog", "warning")),
+            (48, ("fog", "warning")),
+        ],
+    )
+    def test_code_triggers_advisory(self, code, expected):
+        assert _triggered(weather_for_code(code)) == [expected]
+
+    @pytest.mark.parametrize(
+        "precipitation_mm, expected",
+        [
+            (3.9, []),
+            (4.0, [("moderate_rain", "warning")]),
+            (7.4, [("moderate_rain", "warning")]),
+            (7.5, [("heavy_rain", "danger")]),
+        ],
+    )
+    def test_precipitation_thresholds(self, precipitation_mm, expected):
+        weather = make_weather(weather_code=0, precipitation_mm=precipitation_mm)
+        assert _triggered(weather) == expected
+
+    @pytest.mark.parametrize(
+        "wind_speed_kmh, expected",
+        [
+            (49.9, []),
+            (50.0, [("high_wind", "warning")]),
+            (74.9, [("high_wind", "warning")]),
+            (75.0, [("high_wind", "danger")]),
+        ],
+    )
+    def test_wind_thresholds(self, wind_speed_kmh, expected):
+        assert _triggered(make_weather(wind_speed_kmh=wind_speed_kmh)) == expected
+
+    @pytest.mark.parametrize("code", [-1, 128, 200])
+    def test_out_of_range_codes_trigger_no_code_rules(self, code):
+        assert _triggered(weather_for_code(code)) == []
+
+
+# ---------------------------------------------------------------------------
+# _pending_advisories / _build_advisories
+# ---------------------------------------------------------------------------
+
+
+class TestPendingAdvisories:
+    def test_each_advisory_reported_once_at_first_trigger(self):
+        wps = [
+            make_waypoint(lat=35.0, weather=weather_for_code(1)),
+            make_waypoint(lat=36.0, weather=make_weather(weather_code=95, wind_speed_kmh=60)),
+            make_waypoint(lat=37.0, weather=None),
+            make_waypoint(lat=38.0, weather=make_weather(weather_code=95, wind_speed_kmh=80)),
+        ]
+        names = {(lat, -122.42): f"Town{lat:.0f}" for lat in (35.0, 36.0, 37.0, 38.0)}
+
+        advisories = _build_advisories(_pending_advisories(wps), names)
+
+        messages = {(a.type, a.severity): a.message for a in advisories}
+        assert messages == {
+            ("thunderstorm", "danger"): "Thunderstorm expected near Town36",
+            ("high_wind", "danger"): "Dangerous winds (80 km/h) near Town38",
+            ("high_wind", "warning"): "Strong winds (60 km/h) near Town36",
+        }
+
+    def test_every_rule_reported_when_all_trigger(self):
+        triggers = [(65, 0), (63, 0), (56, 0), (73, 0), (71, 0), (0, 80), (0, 60), (95, 0), (96, 0), (45, 0)]
+        wps = [
+            make_waypoint(weather=make_weather(weather_code=code, wind_speed_kmh=wind))
+            for code, wind in triggers * 2
+        ]
+        pending = _pending_advisories(wps)
+        assert len(pending) == len(triggers)
+        assert len({(t, s) for t, s, *_ in pending}) == len(triggers)
+
+    def test_no_weather_yields_nothing(self):
+        assert _pending_advisories([make_waypoint(weather=None)]) == []
+
+    def test_danger_sorted_before_warning(self):
+        wp = make_waypoint(weather=make_weather(weather_code=45, wind_speed_kmh=80))
+        advisories = _build_advisories(_pending_advisories([wp]), {})
+        assert [(a.type, a.severity) for a in advisories] == [
+            ("high_wind", "danger"),
+            ("fog", "warning"),
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -212,35 +363,61 @@ class TestGenerateReason:
         reason = _generate_reason(route, duration_score=100, weather_score=30, min_duration=100)
         assert "poor weather" in reason
 
+    @pytest.mark.parametrize(
+        "weather_score, phrase",
+        [(80, "mostly clear"), (60, "fair weather"), (40, "some adverse"), (39.9, "poor weather")],
+    )
+    def test_band_boundaries(self, weather_score, phrase):
+        route = make_route(total_duration_minutes=100)
+        reason = _generate_reason(
+            route, duration_score=100, weather_score=weather_score, min_duration=100
+        )
+        assert phrase in reason
+
 
 # ---------------------------------------------------------------------------
 # score_routes
 # ---------------------------------------------------------------------------
 
 
+# Stands in for reverse geocoding in every score_routes test; ``mock_geo``
+# resets it and patches it in, so tests only set non-default results.
+_GEOCODE_STUB = AsyncMock()
+
+
+@pytest.fixture
+def mock_geo():
+    _GEOCODE_STUB.reset_mock(return_value=True, side_effect=True)
+    _GEOCODE_STUB.return_value = {}
+    with patch("app.services.scoring._reverse_geocode_batch", new=_GEOCODE_STUB):
+        yield _GEOCODE_STUB
+
+
 class TestScoreRoutes:
+    @pytest.fixture(autouse=True)
+    def clear_score_cache(self):
+        scoring._score_cache.clear()
+        yield
+        scoring._score_cache.clear()
+
     @pytest.mark.asyncio
-    async def test_returns_recommendation_with_scores(self):
+    async def test_returns_recommendation_with_scores(self, mock_geo):
         """score_routes returns a RouteRecommendation with scores for each route."""
         route1 = make_route(route_index=0, total_duration_minutes=100)
         route2 = make_route(route_index=1, total_duration_minutes=120)
 
-        with patch("app.services.scoring._reverse_geocode_batch", new_callable=AsyncMock) as mock_geo:
-            mock_geo.return_value = {}
-            result = await score_routes([route1, route2])
+        result = await score_routes([route1, route2])
 
         assert result.recommended_route_index in (0, 1)
         assert len(result.scores) == 2
         assert len(result.advisories) == 2
 
     @pytest.mark.asyncio
-    async def test_scores_clipped_to_0_100(self):
+    async def test_scores_clipped_to_0_100(self, mock_geo):
         """ML model predictions should be clipped to [0, 100]."""
         route = make_route(route_index=0, total_duration_minutes=100)
 
-        with patch("app.services.scoring._reverse_geocode_batch", new_callable=AsyncMock) as mock_geo:
-            mock_geo.return_value = {}
-            result = await score_routes([route])
+        result = await score_routes([route])
 
         score = result.scores[0].overall_score
         assert 0 <= score <= 100
@@ -251,36 +428,89 @@ class TestScoreRoutes:
             await score_routes([])
 
     @pytest.mark.asyncio
-    async def test_advisories_generated_for_bad_weather(self):
+    async def test_advisories_generated_for_bad_weather(self, mock_geo):
         """Routes with bad weather should produce advisories."""
         w_storm = make_weather(weather_code=95, wind_speed_kmh=80)
         wp = make_waypoint(weather=w_storm)
         route = make_route(route_index=0, waypoints=[wp])
 
-        with patch("app.services.scoring._reverse_geocode_batch", new_callable=AsyncMock) as mock_geo:
-            mock_geo.return_value = {
-                (wp.location.lat, wp.location.lng): "TestTown, CA"
-            }
-            result = await score_routes([route])
+        mock_geo.return_value = {
+            (wp.location.lat, wp.location.lng): "TestTown, CA"
+        }
+        result = await score_routes([route])
 
         assert len(result.advisories[0]) > 0
         severities = [a.severity for a in result.advisories[0]]
         assert "danger" in severities
 
     @pytest.mark.asyncio
-    async def test_recommendation_reason_contains_text(self):
+    async def test_advisory_locations_geocoded_in_one_batch(self, mock_geo):
+        """Advisories from all routes share a single reverse-geocoding call."""
+        w_storm = weather_for_code(95)
+        shared = make_waypoint(lat=36.0, weather=w_storm)
+        route1 = make_route(route_index=0, waypoints=[shared])
+        route2 = make_route(route_index=1, waypoints=[shared, make_waypoint(lat=37.0, weather=w_storm)])
+
+        mock_geo.return_value = {(36.0, -122.42): "TestTown, CA"}
+        result = await score_routes([route1, route2])
+
+        mock_geo.assert_awaited_once_with([(36.0, -122.42)])
+        assert result.advisories[0][0].message == "Thunderstorm expected near TestTown, CA"
+        assert result.advisories[1][0].message == "Thunderstorm expected near TestTown, CA"
+
+    @pytest.mark.asyncio
+    async def test_geocoding_failure_falls_back_to_coordinates(self, mock_geo):
+        wp = make_waypoint(lat=36.0, weather=weather_for_code(95))
+        route = make_route(route_index=0, waypoints=[wp])
+
+        mock_geo.side_effect = RuntimeError("geocoding down")
+        result = await score_routes([route])
+
+        assert result.advisories[0][0].message == (
+            "Thunderstorm expected near 36.0\u00b0N, 122.4\u00b0W"
+        )
+
+    @pytest.mark.asyncio
+    async def test_geocode_mode_off_uses_trip_minutes(self, mock_geo, monkeypatch):
+        monkeypatch.setattr(scoring.settings, "advisory_geocode_mode", "off")
+        wp = make_waypoint(minutes_from_start=45, weather=weather_for_code(95))
+        route = make_route(route_index=0, waypoints=[wp])
+
+        result = await score_routes([route])
+
+        mock_geo.assert_not_called()
+        assert result.advisories[0][0].message == "Thunderstorm expected ~45 min into the drive"
+
+    @pytest.mark.asyncio
+    async def test_geocode_mode_danger_skips_warnings(self, mock_geo, monkeypatch):
+        monkeypatch.setattr(scoring.settings, "advisory_geocode_mode", "danger")
+        wps = [
+            make_waypoint(lat=36.0, weather=weather_for_code(95)),
+            make_waypoint(lat=37.0, minutes_from_start=15, weather=weather_for_code(45)),
+        ]
+        route = make_route(route_index=0, waypoints=wps)
+
+        mock_geo.return_value = {(36.0, -122.42): "TestTown, CA"}
+        result = await score_routes([route])
+
+        mock_geo.assert_awaited_once_with([(36.0, -122.42)])
+        assert [a.message for a in result.advisories[0]] == [
+            "Thunderstorm expected near TestTown, CA",
+            "Fog ~15 min into the drive \u2014 reduced visibility",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_recommendation_reason_contains_text(self, mock_geo):
         route = make_route(route_index=0, total_duration_minutes=100)
 
-        with patch("app.services.scoring._reverse_geocode_batch", new_callable=AsyncMock) as mock_geo:
-            mock_geo.return_value = {}
-            result = await score_routes([route])
+        result = await score_routes([route])
 
         reason = result.scores[0].recommendation_reason
         assert isinstance(reason, str)
         assert len(reason) > 0
 
     @pytest.mark.asyncio
-    async def test_best_route_is_argmax(self):
+    async def test_best_route_is_argmax(self, mock_geo):
         """The recommended route should be the one with the highest score."""
         # Two routes: one fast+clear, one slow+bad weather
         w_clear = make_weather(weather_code=0, wind_speed_kmh=5, precipitation_mm=0)
@@ -296,10 +526,54 @@ class TestScoreRoutes:
             waypoints=[make_waypoint(weather=w_storm)],
         )
 
-        with patch("app.services.scoring._reverse_geocode_batch", new_callable=AsyncMock) as mock_geo:
-            mock_geo.return_value = {}
-            result = await score_routes([route_good, route_bad])
+        result = await score_routes([route_good, route_bad])
 
         # The good route should score higher
         assert result.scores[0].overall_score >= result.scores[1].overall_score
         assert result.recommended_route_index == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_inputs_reuse_recommendation(self, mock_geo):
+        """Re-scoring the same routes skips inference and geocoding."""
+        wp = make_waypoint(lat=36.0, weather=weather_for_code(95))
+        mock_geo.return_value = {(36.0, -122.42): "TestTown, CA"}
+
+        first = await score_routes([make_route(route_index=0, waypoints=[wp])])
+        with patch.object(scoring._model, "predict", side_effect=AssertionError):
+            second = await score_routes([make_route(route_index=0, waypoints=[wp])])
+
+        assert second == first
+        assert second is not first
+        mock_geo.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_prediction_failure_cancels_geocoding(self, mock_geo):
+        cancelled = asyncio.Event()
+
+        async def hang(_coords):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_geo.side_effect = hang
+        wp = make_waypoint(lat=36.0, weather=weather_for_code(95))
+        with patch.object(scoring._model, "predict", side_effect=RuntimeError("model down")):
+            with pytest.raises(RuntimeError, match="model down"):
+                await score_routes([make_route(route_index=0, waypoints=[wp])])
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_geocoding_fallback_not_reused(self, mock_geo):
+        wp = make_waypoint(lat=36.0, weather=weather_for_code(95))
+        mock_geo.side_effect = RuntimeError("geocoding down")
+        await score_routes([make_route(route_index=0, waypoints=[wp])])
+
+        mock_geo.side_effect = None
+        mock_geo.return_value = {(36.0, -122.42): "TestTown, CA"}
+        result = await score_routes([make_route(route_index=0, waypoints=[wp])])
+
+        assert result.advisories[0][0].message == "Thunderstorm expected near TestTown, CA"
+        assert mock_geo.await_count == 2
@@ -1,14 +1,17 @@
 """Tests for app.services.weather — Open-Meteo API client."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 import respx
 
 from app.models import LatLng, Waypoint
+from app.services import weather
 from app.services.weather import (
     HOURLY_PARAMS,
+    MAX_LOCATIONS_PER_REQUEST,
     OPEN_METEO_URL,
     WMO_CODES,
     get_weather_for_waypoints,
@@ -65,6 +68,12 @@ def _hourly_response(
 
 
 class TestGetWeatherForWaypoints:
+    @pytest.fixture(autouse=True)
+    def clear_weather_cache(self):
+        weather._weather_cache.clear()
+        yield
+        weather._weather_cache.clear()
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_successful_fetch_populates_weather(self):
@@ -143,6 +152,18 @@ class TestGetWeatherForWaypoints:
         assert wp.weather.weather_description == WMO_CODES[45]
         assert wp.weather.weather_description == "Fog"
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_float_wmo_code_mapped_to_description(self):
+        respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(200, json=_hourly_response(weather_code=3.0))
+        )
+        wp = _make_wp()
+        await get_weather_for_waypoints([wp])
+
+        assert wp.weather is not None
+        assert wp.weather.weather_description == "Overcast"
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_unknown_wmo_code_returns_unknown(self):
@@ -157,22 +178,23 @@ class TestGetWeatherForWaypoints:
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_missing_hourly_key_raises_runtime_error(self):
-        """If the response has no 'hourly' key, a RuntimeError should propagate."""
+    async def test_missing_hourly_key_leaves_weather_none(self):
+        """If the response has no 'hourly' key, the waypoint gets no weather."""
         respx.get(OPEN_METEO_URL).mock(
             return_value=httpx.Response(200, json={"error": True, "reason": "bad request"})
         )
         wp = _make_wp()
-        # The error is caught by asyncio.gather(return_exceptions=True) in
-        # get_weather_for_waypoints, so weather stays None
         result = await get_weather_for_waypoints([wp])
         assert result[0].weather is None
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_multiple_waypoints_fetched_in_parallel(self):
+    async def test_multiple_waypoints_fetched_in_one_batch(self):
         route = respx.get(OPEN_METEO_URL).mock(
-            return_value=httpx.Response(200, json=_hourly_response())
+            return_value=httpx.Response(
+                200,
+                json=[_hourly_response(temperature=t) for t in (10.0, 20.0, 30.0)],
+            )
         )
         wp1 = _make_wp(lat=37.77, lng=-122.42)
         wp2 = _make_wp(lat=34.05, lng=-118.24)
@@ -180,34 +202,181 @@ class TestGetWeatherForWaypoints:
 
         await get_weather_for_waypoints([wp1, wp2, wp3])
 
-        assert route.call_count == 3
-        assert wp1.weather is not None
-        assert wp2.weather is not None
-        assert wp3.weather is not None
+        assert route.call_count == 1
+        params = route.calls[0].request.url.params
+        assert params["latitude"] == "37.77,34.05,40.71"
+        assert params["longitude"] == "-122.42,-118.24,-74.01"
+        assert [wp.weather.temperature_c for wp in (wp1, wp2, wp3)] == [10.0, 20.0, 30.0]
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_one_failure_doesnt_block_others(self):
-        """If one waypoint fetch fails, others should still succeed."""
+    async def test_same_cell_and_hour_fetched_once(self):
+        route = respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json=[_hourly_response(temperature=t) for t in (10.0, 20.0)],
+            )
+        )
+        wp1 = _make_wp(lat=37.7712, lng=-122.4188)
+        wp2 = _make_wp(lat=34.05, lng=-118.24)
+        wp3 = _make_wp(lat=37.7749, lng=-122.4194)  # same cell and hour as wp1
+
+        await get_weather_for_waypoints([wp1, wp2, wp3])
+
+        assert route.call_count == 1
+        assert route.calls[0].request.url.params["latitude"] == "37.7712,34.05"
+        assert [wp.weather.temperature_c for wp in (wp1, wp2, wp3)] == [10.0, 20.0, 10.0]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_waypoints_grouped_by_date_and_chunked(self):
         def responder(request: httpx.Request) -> httpx.Response:
-            lat = request.url.params.get("latitude")
-            if lat == "34.05":
-                return httpx.Response(500, json={"error": "server error"})
-            if lat == "37.77":
-                return httpx.Response(200, json=_hourly_response(temperature=10.0))
-            return httpx.Response(200, json=_hourly_response(temperature=20.0))
+            count = len(request.url.params["latitude"].split(","))
+            return httpx.Response(200, json=[_hourly_response()] * count)
+
+        route = respx.get(OPEN_METEO_URL).mock(side_effect=responder)
+        day_one = [_make_wp(lat=30 + i * 0.1) for i in range(MAX_LOCATIONS_PER_REQUEST + 1)]
+        day_two = Waypoint(
+            location=LatLng(lat=35.0, lng=-120.0),
+            minutes_from_start=900,
+            estimated_time=datetime(2026, 2, 17, 1, 0, tzinfo=timezone.utc),
+        )
 
-        respx.get(OPEN_METEO_URL).mock(side_effect=responder)
+        await get_weather_for_waypoints([*day_one, day_two])
+
+        start_dates = sorted(call.request.url.params["start_date"] for call in route.calls)
+        assert start_dates == ["2026-02-16", "2026-02-16", "2026-02-17"]
+        assert all(wp.weather is not None for wp in [*day_one, day_two])
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_one_failure_doesnt_block_others(self):
+        """A location without hourly data leaves only that waypoint empty."""
+        respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json=[
+                    _hourly_response(temperature=10.0),
+                    {"error": True, "reason": "bad location"},
+                    _hourly_response(temperature=20.0),
+                ],
+            )
+        )
+        wp1 = _make_wp(lat=37.77, lng=-122.42)
+        wp2 = _make_wp(lat=34.05, lng=-118.24)
+        wp3 = _make_wp(lat=40.71, lng=-74.01)
+
+        await get_weather_for_waypoints([wp1, wp2, wp3])
+
+        assert wp1.weather is not None
+        assert wp1.weather.temperature_c == 10.0
+        assert wp2.weather is None
+        assert wp3.weather is not None
+        assert wp3.weather.temperature_c == 20.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_malformed_location_doesnt_block_others(self):
+        """A location whose hourly data can't be parsed leaves only that waypoint empty."""
+        malformed = _hourly_response()
+        malformed["hourly"]["weather_code"] = [None] * 24
+        respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json=[
+                    _hourly_response(temperature=10.0),
+                    malformed,
+                    _hourly_response(temperature=20.0),
+                ],
+            )
+        )
         wp1 = _make_wp(lat=37.77, lng=-122.42)
         wp2 = _make_wp(lat=34.05, lng=-118.24)
         wp3 = _make_wp(lat=40.71, lng=-74.01)
 
         await get_weather_for_waypoints([wp1, wp2, wp3])
 
-        # wp1 and wp3 should have weather; wp2 should not (server returned no hourly)
         assert wp1.weather is not None
         assert wp1.weather.temperature_c == 10.0
-        # wp2 got a 500 with no "hourly" key → RuntimeError → weather stays None
         assert wp2.weather is None
         assert wp3.weather is not None
         assert wp3.weather.temperature_c == 20.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_batch_doesnt_block_other_dates(self):
+        def responder(request: httpx.Request) -> httpx.Response:
+            if request.url.params["start_date"] == "2026-02-16":
+                return httpx.Response(500, json={"error": "server error"})
+            return httpx.Response(200, json=_hourly_response(temperature=20.0))
+
+        respx.get(OPEN_METEO_URL).mock(side_effect=responder)
+        wp1 = _make_wp(lat=37.77, lng=-122.42)
+        wp2 = Waypoint(
+            location=LatLng(lat=34.05, lng=-118.24),
+            minutes_from_start=900,
+            estimated_time=datetime(2026, 2, 17, 1, 0, tzinfo=timezone.utc),
+        )
+
+        with patch("app.services.http_client.asyncio.sleep", new_callable=AsyncMock):
+            await get_weather_for_waypoints([wp1, wp2])
+
+        # The 500 persists through the retries and raise_for_status fails
+        # the first date's batch as a whole
+        assert wp1.weather is None
+        assert wp2.weather is not None
+        assert wp2.weather.temperature_c == 20.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cached_cells_skip_the_api(self):
+        route = respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(200, json=_hourly_response(temperature=18.5))
+        )
+        await get_weather_for_waypoints([_make_wp(lat=37.7712, lng=-122.4188)])
+        # Same 0.01° cell and hour, different exact coordinates
+        wp = _make_wp(lat=37.7749, lng=-122.4194)
+        await get_weather_for_waypoints([wp])
+
+        assert route.call_count == 1
+        assert wp.weather is not None
+        assert wp.weather.temperature_c == 18.5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cache_keyed_by_local_hour(self):
+        """In a half-hour-offset zone, one epoch hour spans two local hours."""
+        resp_data = _hourly_response()
+        resp_data["hourly"]["temperature_2m"] = list(range(24))
+        route = respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(200, json=resp_data)
+        )
+        ist = timezone(timedelta(hours=5, minutes=30))
+        wp1 = Waypoint(
+            location=LatLng(lat=28.61, lng=77.21),
+            minutes_from_start=0,
+            estimated_time=datetime(2026, 2, 16, 10, 50, tzinfo=ist),
+        )
+        wp2 = Waypoint(
+            location=LatLng(lat=28.61, lng=77.21),
+            minutes_from_start=20,
+            estimated_time=datetime(2026, 2, 16, 11, 10, tzinfo=ist),
+        )
+
+        await get_weather_for_waypoints([wp1])
+        await get_weather_for_waypoints([wp2])
+
+        assert route.call_count == 2
+        assert wp1.weather.temperature_c == 10.0
+        assert wp2.weather.temperature_c == 11.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_fetches_are_not_cached(self):
+        route = respx.get(OPEN_METEO_URL).mock(
+            return_value=httpx.Response(200, json={"error": True, "reason": "bad request"})
+        )
+        await get_weather_for_waypoints([_make_wp()])
+        await get_weather_for_waypoints([_make_wp()])
+
+        assert route.call_count == 2